@@ -5,15 +5,37 @@ Simple API Server for AI Debug Assistant
 Provides REST endpoints for the Python backend modules.
 """
 
+import gzip
 import json
 import os
-import tempfile
+import queue
+import sys
 import zipfile
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import threading
 import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from types import GeneratorType
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup, fall back to the standard library encoder
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    # Optional, gzip is used when zstd isn't available
+    zstandard = None
 
 # Import our modules
 from prompt_refiner import PromptRefiner
@@ -23,60 +45,350 @@ from debugger_engine import DebuggerEngine
 from run_full_analysis import run_full_analysis
 
 
+# Shared pool for the blocking analyzer work, sized via WORKERS
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get('WORKERS', 8)))
+
+# Responses smaller than this aren't worth compressing
+COMPRESSION_MIN_SIZE = 1024
+
+# Background /full-analysis jobs run on their own small pool so a backlog of
+# jobs can't starve request handlers waiting on EXECUTOR
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get('JOB_WORKERS', 4)))
+
+# Caps queued plus running jobs; beyond this clients get 429 instead of a queue slot
+MAX_PENDING_JOBS = int(os.environ.get('MAX_PENDING_JOBS', 64))
+_job_slots = threading.BoundedSemaphore(MAX_PENDING_JOBS)
+
+# Finished jobs stay pollable for this long, then their results are dropped from
+# memory. Report files stay on disk in run_full_analysis's shared output dirs.
+JOB_RETENTION_SECONDS = float(os.environ.get('JOB_RETENTION_SECONDS', 3600))
+MAX_FINISHED_JOBS = int(os.environ.get('MAX_FINISHED_JOBS', 256))
+
+# Background /full-analysis jobs, keyed by job id; _finished_jobs holds the
+# finish times of completed ones, oldest first, so eviction pops from the front
+JOBS = {}
+_finished_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+
+# PromptRefiner keeps no per-call state, so one instance serves every request
+REFINER = PromptRefiner()
+
+# SpecComparer and DebuggerEngine hold per-call state; each pool worker reuses its own
+_worker_state = threading.local()
+
+
+def worker_instance(cls):
+    """Return the current thread's reusable instance of a stateful module class"""
+    instances = getattr(_worker_state, 'instances', None)
+    if instances is None:
+        instances = _worker_state.instances = {}
+    if cls not in instances:
+        instances[cls] = cls()
+    return instances[cls]
+
+
+def analyze_codebase(codebase_path: str):
+    """Run the CodeAnalyzer over a codebase and return its feature map"""
+    analyzer = CodeAnalyzer(codebase_path)
+    analyzer.analyze_project()
+    return analyzer.get_feature_map_dict()
+
+
+def compare_spec(enhanced_spec, feature_map):
+    """Compare a spec with a feature map on the worker's SpecComparer"""
+    comparer = worker_instance(SpecComparer)
+    # Copy so the worker's next comparison can't mutate the returned results
+    return dict(comparer.compare_spec_dict(enhanced_spec, feature_map))
+
+
+def debug_comparison(comparison_report):
+    """Generate bugs, fixes and severity counts on the worker's DebuggerEngine"""
+    engine = worker_instance(DebuggerEngine)
+    if not engine.load_comparison_dict(comparison_report):
+        return None
+    bugs = engine.analyze_bugs()
+    fixes = engine.generate_fixes()
+    return bugs, fixes, engine._get_bugs_by_severity()
+
+
+def finish_job(job_id: str):
+    """Release a finished job's slot and start its retention window"""
+    with _jobs_lock:
+        _finished_jobs[job_id] = time.monotonic()
+    _job_slots.release()
+    prune_jobs()
+
+
+def prune_jobs():
+    """Evict finished jobs past their retention window or beyond MAX_FINISHED_JOBS"""
+    cutoff = time.monotonic() - JOB_RETENTION_SECONDS
+    with _jobs_lock:
+        while _finished_jobs:
+            job_id, finished_at = next(iter(_finished_jobs.items()))
+            if finished_at > cutoff and len(_finished_jobs) <= MAX_FINISHED_JOBS:
+                break
+            _finished_jobs.popitem(last=False)
+            JOBS.pop(job_id, None)
+
+
+def codebase_fingerprint(codebase_path: str):
+    """Cheap change marker for a codebase: file count and newest mtime"""
+    code_files = CodeAnalyzer(codebase_path)._get_code_files()
+    newest = max((os.stat(path).st_mtime_ns for path, _ in code_files), default=0)
+    return len(code_files), newest
+
+
+def snapshot_key(codebase_path: str):
+    """Identify a codebase's current contents: real path plus fingerprint"""
+    return os.path.realpath(codebase_path), codebase_fingerprint(codebase_path)
+
+
+@lru_cache(maxsize=64)
+def analyze_snapshot(codebase_path: str, fingerprint):
+    """Analyze a codebase, memoized while its fingerprint is unchanged"""
+    return analyze_codebase(codebase_path)
+
+
+class BatchedAnalyzer:
+    """Coalesce concurrent analyses of the same codebase into a single run"""
+    
+    def __init__(self, executor):
+        self._executor = executor
+        self._pending = {}
+        self._lock = threading.Lock()
+    
+    def apply(self, codebase_path: str):
+        """Analyze a codebase, joining any in-flight run for the same snapshot"""
+        return self.run(snapshot_key(codebase_path))
+    
+    def run(self, key):
+        """Analyze the snapshot named by a snapshot_key()"""
+        with self._lock:
+            future = self._pending.get(key)
+            is_new = future is None
+            if is_new:
+                future = self._executor.submit(analyze_snapshot, *key)
+                self._pending[key] = future
+        
+        if is_new:
+            future.add_done_callback(lambda done: self._release(key, done))
+        return future.result()
+    
+    def _release(self, key, future):
+        """Drop a finished run so later requests see fresh results"""
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+
+BATCHED_ANALYZER = BatchedAnalyzer(EXECUTOR)
+
+
+@lru_cache(maxsize=128)
+def compare_snapshot(spec_json: bytes, snapshot):
+    """Compare a projected spec with a codebase snapshot, memoized per pair"""
+    return compare_spec(loads_json(spec_json), analyze_snapshot(*snapshot))
+
+
+def compare_spec_cached(enhanced_spec, codebase_path: str):
+    """Compare a spec with a codebase, reusing results for repeated inputs"""
+    snapshot = snapshot_key(codebase_path)
+    BATCHED_ANALYZER.run(snapshot)
+    # Only the fields SpecComparer reads go into the key, so unrelated spec
+    # content neither busts the cache nor gets re-encoded
+    spec_json = dumps_json_compact(SpecComparer.project_spec(enhanced_spec))
+    return EXECUTOR.submit(compare_snapshot, spec_json, snapshot).result()
+
+
+def _json_default(obj):
+    """Serialize objects the JSON encoders don't handle natively"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def dumps_json(data) -> bytes:
+    """Encode a response payload to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+def dumps_json_compact(data) -> bytes:
+    """Encode a value to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def iter_json_chunks(data: dict, chunk_size: int = 64 * 1024):
+    """Yield a JSON object in chunks, encoding list values one element at a time"""
+    buffer = bytearray(b'{')
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            buffer += b','
+        buffer += dumps_json_compact(key) + b':'
+        if isinstance(value, (list, tuple, GeneratorType)):
+            buffer += b'['
+            for j, item in enumerate(value):
+                if j:
+                    buffer += b','
+                buffer += dumps_json_compact(item)
+                if len(buffer) >= chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+            buffer += b']'
+        else:
+            buffer += dumps_json_compact(value)
+    buffer += b'}'
+    yield bytes(buffer)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a complete response body with gzip or zstd"""
+    if encoding == 'zstd':
+        # Compressor contexts aren't thread-safe, so each thread reuses its own
+        return worker_instance(zstandard.ZstdCompressor).compress(body)
+    return gzip.compress(body, compresslevel=5)
+
+
+def stream_compressor(encoding: str):
+    """Create an incremental compressor for a streamed response"""
+    if encoding == 'zstd':
+        return worker_instance(zstandard.ZstdCompressor).compressobj()
+    # wbits=31 selects the gzip container
+    return zlib.compressobj(5, zlib.DEFLATED, 31)
+
+
+def iter_compressed(chunks, compressor):
+    """Compress a stream of chunks, skipping empty compressor output"""
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    tail = compressor.flush()
+    if tail:
+        yield tail
+
+
+def loads_json(raw: bytes):
+    """Decode a JSON request body without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_iso_timestamp = (0, '')
+
+
+def now_iso() -> str:
+    """Current local time in ISO format, cached at one-second resolution"""
+    global _iso_timestamp
+    second = int(time.time())
+    cached_second, timestamp = _iso_timestamp
+    if cached_second != second:
+        timestamp = datetime.fromtimestamp(second).isoformat()
+        _iso_timestamp = (second, timestamp)
+    return timestamp
+
+
+# Request log lines are queued by handlers and written by a single background thread
+_LOG_QUEUE = queue.SimpleQueue()
+
+
+def log_writer():
+    """Drain queued log lines to stdout, one write per batch; stops on None"""
+    while True:
+        lines = [_LOG_QUEUE.get()]
+        while not _LOG_QUEUE.empty() and len(lines) < 1024:
+            lines.append(_LOG_QUEUE.get_nowait())
+        running = lines[-1] is not None
+        if not running:
+            lines.pop()
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
+        if not running:
+            return
+
+
+LOG_THREAD = threading.Thread(target=log_writer, name='log-writer', daemon=True)
+LOG_THREAD.start()
+
+
+@lru_cache(maxsize=256)
+def request_path(raw_path: str) -> str:
+    """Extract the route path from a request target"""
+    return urlparse(raw_path).path
+
+
+# Static GET bodies are encoded once; /health only splices in its timestamp
+ROOT_BODY = dumps_json({'message': 'AI Debug Assistant API', 'version': '1.0.0'})
+MODULES_BODY = dumps_json({
+    'modules': [
+        'prompt_refiner',
+        'code_analyzer',
+        'spec_comparer',
+        'debugger_engine',
+        'full_analysis'
+    ]
+})
+HEALTH_BODY_TEMPLATE = dumps_json({'status': 'healthy', 'timestamp': '%s'})
+
+
 class APIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the API"""
     
+    # HTTP/1.1 keeps connections open between requests; every response must
+    # therefore carry a Content-Length or use chunked encoding
+    protocol_version = 'HTTP/1.1'
+    
+    # Close idle keep-alive connections so they don't pin server threads
+    timeout = int(os.environ.get('KEEPALIVE_TIMEOUT', 30))
+    
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def do_GET(self):
         """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        path = request_path(self.path)
         
-        if path == '/':
-            self.send_json_response({'message': 'AI Debug Assistant API', 'version': '1.0.0'})
-        elif path == '/health':
-            self.send_json_response({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
-        elif path == '/modules':
-            self.send_json_response({
-                'modules': [
-                    'prompt_refiner',
-                    'code_analyzer', 
-                    'spec_comparer',
-                    'debugger_engine',
-                    'full_analysis'
-                ]
-            })
+        handler = self.GET_ROUTES.get(path)
+        if handler is not None:
+            handler(self)
+        elif path.startswith('/jobs/'):
+            job_id, _, resource = path[len('/jobs/'):].partition('/')
+            if not resource:
+                self.handle_job_status(job_id)
+            elif resource == 'report':
+                self.handle_job_report(job_id)
+            else:
+                self.send_error(404, 'Endpoint not found')
         else:
             self.send_error(404, 'Endpoint not found')
     
     def do_POST(self):
         """Handle POST requests"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        path = request_path(self.path)
         
         try:
             # Read request body
             content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            post_data = self.read_body(content_length)
+            data = loads_json(post_data)
             
-            if path == '/refine-prompt':
-                self.handle_refine_prompt(data)
-            elif path == '/analyze-code':
-                self.handle_analyze_code(data)
-            elif path == '/compare-spec':
-                self.handle_compare_spec(data)
-            elif path == '/debug-analysis':
-                self.handle_debug_analysis(data)
-            elif path == '/full-analysis':
-                self.handle_full_analysis(data)
+            handler = self.POST_ROUTES.get(path)
+            if handler is not None:
+                handler(self, data)
             else:
                 self.send_error(404, 'Endpoint not found')
                 
@@ -85,6 +397,32 @@ class APIHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f'Internal server error: {str(e)}')
     
+    def read_body(self, content_length):
+        """Read the request body into a single preallocated buffer"""
+        # rfile may already hold the start of the body from header parsing,
+        # so read through it rather than from the raw socket
+        body = bytearray(content_length)
+        view = memoryview(body)
+        received = 0
+        while received < content_length:
+            count = self.rfile.readinto(view[received:])
+            if not count:
+                raise ConnectionError('Request body ended early')
+            received += count
+        return body
+    
+    def handle_root(self):
+        """Handle API info requests"""
+        self.send_json_bytes(ROOT_BODY)
+    
+    def handle_health(self):
+        """Handle health check requests"""
+        self.send_json_bytes(HEALTH_BODY_TEMPLATE % now_iso().encode())
+    
+    def handle_modules(self):
+        """Handle module listing requests"""
+        self.send_json_bytes(MODULES_BODY)
+    
     def handle_refine_prompt(self, data):
         """Handle prompt refinement requests"""
         original_prompt = data.get('prompt', '')
@@ -92,32 +430,30 @@ class APIHandler(BaseHTTPRequestHandler):
             self.send_error(400, 'Missing prompt field')
             return
         
-        refiner = PromptRefiner()
-        enhanced_spec = refiner.refine_prompt(original_prompt)
+        enhanced_spec = REFINER.refine_prompt(original_prompt)
         
         self.send_json_response({
             'success': True,
             'enhanced_spec': enhanced_spec,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         })
     
     def handle_analyze_code(self, data):
         """Handle code analysis requests"""
         codebase_path = data.get('codebase_path', 'src/')
         
-        analyzer = CodeAnalyzer()
         try:
-            analysis_result = analyzer.analyze_codebase(codebase_path)
+            analysis_result = BATCHED_ANALYZER.apply(codebase_path)
             self.send_json_response({
                 'success': True,
                 'analysis': analysis_result,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
         except Exception as e:
             self.send_json_response({
                 'success': False,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
     
     def handle_compare_spec(self, data):
@@ -129,23 +465,13 @@ class APIHandler(BaseHTTPRequestHandler):
             self.send_error(400, 'Missing enhanced_spec field')
             return
         
-        # Save enhanced spec to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(enhanced_spec, f, indent=2)
-            spec_file = f.name
+        comparison_result = compare_spec_cached(enhanced_spec, codebase_path)
         
-        try:
-            comparer = SpecComparer()
-            comparison_result = comparer.compare_spec_to_codebase(spec_file, codebase_path)
-            
-            self.send_json_response({
-                'success': True,
-                'comparison': comparison_result,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            # Clean up temporary file
-            os.unlink(spec_file)
+        self.send_json_response({
+            'success': True,
+            'comparison': comparison_result,
+            'timestamp': now_iso()
+        })
     
     def handle_debug_analysis(self, data):
         """Handle debug analysis requests"""
@@ -155,37 +481,65 @@ class APIHandler(BaseHTTPRequestHandler):
             self.send_error(400, 'Missing comparison_report field')
             return
         
-        # Save comparison report to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(comparison_report, f, indent=2)
-            report_file = f.name
+        debug_result = EXECUTOR.submit(debug_comparison, comparison_report).result()
+        if debug_result is None:
+            self.send_json_response({
+                'success': False,
+                'error': 'Failed to load comparison report'
+            })
+            return
         
-        try:
-            engine = DebuggerEngine()
-            if not engine.load_comparison_report(report_file):
-                self.send_json_response({
-                    'success': False,
-                    'error': 'Failed to load comparison report'
-                })
-                return
-            
-            bugs = engine.analyze_bugs()
-            fixes = engine.generate_fixes()
-            
+        bugs, fixes, bugs_by_severity = debug_result
+        
+        # Bug and fix lists can be large, so encode them as they are sent;
+        # the dataclasses are serialized directly rather than via _bug_to_dict
+        self.send_json_stream({
+            'success': True,
+            'bugs': bugs,
+            'fixes': fixes,
+            'summary': {
+                'total_bugs': len(bugs),
+                'total_fixes': len(fixes),
+                'bugs_by_severity': bugs_by_severity
+            },
+            'timestamp': now_iso()
+        })
+    
+    def handle_pipeline(self, data):
+        """Handle in-memory pipeline requests, returning bugs and fixes directly"""
+        original_prompt = data.get('prompt', '')
+        codebase_path = data.get('codebase_path', 'src/')
+        
+        if not original_prompt:
+            self.send_error(400, 'Missing prompt field')
+            return
+        
+        # Each stage hands its Python objects to the next; nothing touches disk
+        enhanced_spec = asdict(REFINER.generate_enhanced_spec(original_prompt))
+        comparison_result = compare_spec_cached(enhanced_spec, codebase_path)
+        debug_result = EXECUTOR.submit(debug_comparison, comparison_result).result()
+        if debug_result is None:
             self.send_json_response({
-                'success': True,
-                'bugs': [engine._bug_to_dict(bug) for bug in bugs],
-                'fixes': [engine._fix_to_dict(fix) for fix in fixes],
-                'summary': {
-                    'total_bugs': len(bugs),
-                    'total_fixes': len(fixes),
-                    'bugs_by_severity': engine._get_bugs_by_severity()
-                },
-                'timestamp': datetime.now().isoformat()
+                'success': False,
+                'error': 'Failed to load comparison report'
             })
-        finally:
-            # Clean up temporary file
-            os.unlink(report_file)
+            return
+        
+        bugs, fixes, bugs_by_severity = debug_result
+        
+        self.send_json_stream({
+            'success': True,
+            'bugs': bugs,
+            'fixes': fixes,
+            'summary': {
+                'total_bugs': len(bugs),
+                'total_fixes': len(fixes),
+                'bugs_by_severity': bugs_by_severity,
+                'health_score': comparison_result['summary']['health_score'],
+                'overall_status': comparison_result['summary']['overall_status']
+            },
+            'timestamp': now_iso()
+        })
     
     def handle_full_analysis(self, data):
         """Handle full analysis pipeline requests"""
@@ -196,40 +550,160 @@ class APIHandler(BaseHTTPRequestHandler):
             self.send_error(400, 'Missing prompt field')
             return
         
-        # Run analysis in background thread to avoid timeout
-        def run_analysis():
-            try:
-                success = run_full_analysis(original_prompt, codebase_path)
-                # Store result for later retrieval
-                # In a real implementation, you'd use a database or cache
-                print(f"Analysis completed: {'Success' if success else 'Failed'}")
-            except Exception as e:
-                print(f"Analysis failed: {e}")
+        prune_jobs()
+        if not _job_slots.acquire(blocking=False):
+            self.send_error(429, 'Too many analyses in progress, retry later')
+            return
         
-        analysis_thread = threading.Thread(target=run_analysis)
-        analysis_thread.start()
+        # Run analysis in the background to avoid timeout
+        job_id = uuid.uuid4().hex
+        future = JOB_EXECUTOR.submit(run_full_analysis, original_prompt, codebase_path)
+        with _jobs_lock:
+            JOBS[job_id] = future
+        future.add_done_callback(lambda done: finish_job(job_id))
         
         self.send_json_response({
             'success': True,
             'message': 'Full analysis started in background',
             'status': 'processing',
-            'timestamp': datetime.now().isoformat()
+            'job_id': job_id,
+            'timestamp': now_iso()
         })
     
+    def handle_job_status(self, job_id):
+        """Handle polling for a background full analysis job"""
+        future = JOBS.get(job_id)
+        if future is None:
+            self.send_error(404, 'Job not found')
+            return
+        
+        if not future.done():
+            self.send_json_response({'job_id': job_id, 'status': 'processing'})
+        elif future.exception() is not None:
+            self.send_json_response({
+                'job_id': job_id,
+                'status': 'failed',
+                'error': str(future.exception())
+            })
+        else:
+            self.send_json_response({
+                'job_id': job_id,
+                'status': 'completed',
+                'result': future.result()
+            })
+    
+    def handle_job_report(self, job_id):
+        """Handle downloads of a finished job's final analysis report"""
+        future = JOBS.get(job_id)
+        if future is None:
+            self.send_error(404, 'Job not found')
+        elif not future.done():
+            self.send_json_response({'job_id': job_id, 'status': 'processing'}, 202)
+        elif future.exception() is not None:
+            self.send_error(404, 'Job failed, no report available')
+        else:
+            self.send_json_file(future.result()['results']['final_report'])
+    
     def send_json_response(self, data, status_code=200):
         """Send JSON response with CORS headers"""
+        self.send_json_bytes(dumps_json(data), status_code)
+    
+    def send_json_bytes(self, body, status_code=200):
+        """Send a pre-encoded JSON body with CORS headers"""
+        self.log_request(status_code)
+        
+        encoding_headers = ''
+        if len(body) >= COMPRESSION_MIN_SIZE:
+            encoding = self.accepted_encoding()
+            if encoding is not None:
+                body = compress_body(body, encoding)
+                encoding_headers = f"Content-Encoding: {encoding}\r\nVary: Accept-Encoding\r\n"
+        
+        # Status line, headers and body go out in a single write
+        head = (
+            f"{self.protocol_version} {status_code} {self.responses.get(status_code, ('',))[0]}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+            "Content-Type: application/json\r\n"
+            f"{encoding_headers}"
+            f"Content-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "\r\n"
+        )
+        self.wfile.write(head.encode('latin-1') + body)
+    
+    def accepted_encoding(self):
+        """Pick the response compression the client accepts, if any"""
+        accepted = self.headers.get('Accept-Encoding', '')
+        if zstandard is not None and 'zstd' in accepted:
+            return 'zstd'
+        if 'gzip' in accepted:
+            return 'gzip'
+        return None
+    
+    def send_json_file(self, file_path, status_code=200):
+        """Send a JSON file straight from the page cache with sendfile"""
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            
+            self.send_response(status_code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(size))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            self.connection.sendfile(f)
+    
+    def send_json_stream(self, data, status_code=200):
+        """Stream a JSON response without building the whole body in memory"""
+        chunked = self.request_version == 'HTTP/1.1' and self.protocol_version == 'HTTP/1.1'
+        encoding = self.accepted_encoding()
+        compressor = stream_compressor(encoding) if encoding is not None else None
+        
         self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
+        if compressor is not None:
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            # Without chunked encoding the end of the body is the end of the connection
+            self.send_header('Connection', 'close')
+            self.close_connection = True
         self.end_headers()
         
-        response = json.dumps(data, indent=2)
-        self.wfile.write(response.encode('utf-8'))
+        chunks = iter_json_chunks(data)
+        if compressor is not None:
+            chunks = iter_compressed(chunks, compressor)
+        
+        for chunk in chunks:
+            if chunked:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            else:
+                self.wfile.write(chunk)
+        if chunked:
+            self.wfile.write(b'0\r\n\r\n')
     
     def log_message(self, format, *args):
-        """Override to customize logging"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"[{timestamp}] {format % args}")
+        """Override to customize logging, handing the write to the log thread"""
+        _LOG_QUEUE.put_nowait(f"[{now_iso()}] {format % args}\n")
+    
+    GET_ROUTES = {
+        '/': handle_root,
+        '/health': handle_health,
+        '/modules': handle_modules
+    }
+    
+    POST_ROUTES = {
+        '/refine-prompt': handle_refine_prompt,
+        '/analyze-code': handle_analyze_code,
+        '/compare-spec': handle_compare_spec,
+        '/debug-analysis': handle_debug_analysis,
+        '/full-analysis': handle_full_analysis,
+        '/pipeline': handle_pipeline
+    }
 
 
 def main():
@@ -241,24 +715,32 @@ def main():
     print(f"   GET  / - API info")
     print(f"   GET  /health - Health check")
     print(f"   GET  /modules - Available modules")
+    print(f"   GET  /jobs/<id> - Full analysis job status")
+    print(f"   GET  /jobs/<id>/report - Full analysis report")
     print(f"   POST /refine-prompt - Refine original prompt")
     print(f"   POST /analyze-code - Analyze codebase")
     print(f"   POST /compare-spec - Compare spec to code")
     print(f"   POST /debug-analysis - Generate bug reports")
     print(f"   POST /full-analysis - Run complete pipeline")
+    print(f"   POST /pipeline - Run complete pipeline in memory")
     print(f"")
     print(f"🔧 CORS enabled for all origins")
     print(f"📁 Working directory: {os.getcwd()}")
     print(f"🔑 OpenAI API Key: {'✅ Set' if os.getenv('OPENAI_API_KEY') else '❌ Missing'}")
     print("=" * 60)
     
-    server = HTTPServer(('0.0.0.0', port), APIHandler)
+    # One thread per connection so a slow analysis doesn't block other clients
+    server = ThreadingHTTPServer(('0.0.0.0', port), APIHandler)
     
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\\n🛑 Server stopped by user")
         server.shutdown()
+        EXECUTOR.shutdown(wait=False)
+        JOB_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _LOG_QUEUE.put_nowait(None)
+        LOG_THREAD.join(timeout=1)
 
 
 if __name__ == '__main__':
@@ -14,15 +14,31 @@ Version: 1.0.0
 
 import os
 import ast
+import hashlib
+import inspect
 import json
+import multiprocessing
+import pickle
 import re
-from typing import Dict, List, Any, Optional, Set
+import sys
+import tempfile
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup for writing feature maps, json is used without it
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function definition."""
     name: str
@@ -33,7 +49,7 @@ class FunctionInfo:
     is_async: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class definition."""
     name: str
@@ -44,7 +60,7 @@ class ClassInfo:
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportInfo:
     """Information about imports in a file."""
     module: str
@@ -53,7 +69,7 @@ class ImportInfo:
     is_from_import: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DataModelInfo:
     """Information about data models/schemas."""
     name: str
@@ -62,7 +78,7 @@ class DataModelInfo:
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysis:
     """Analysis results for a single file."""
     file_path: str
@@ -89,6 +105,296 @@ class FeatureMap:
     data_models: List[DataModelInfo]
 
 
+# Per-user location used when the cache is enabled without an explicit directory
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'code_analyzer'
+
+# Least recently used entries are evicted once the cache grows past this size
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _cache_salt() -> bytes:
+    """Salt cache keys with this module's source so any analyzer change invalidates them."""
+    source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return f"{source_hash}:{sys.version_info[0]}.{sys.version_info[1]}\0".encode()
+
+
+class SourceAstCache:
+    """
+    Persistent on-disk cache of per-file analysis results.
+    
+    Entries are keyed by the SHA-256 of the file's relative path and content,
+    salted with this module's source hash and the Python version, so unchanged
+    files skip parsing entirely on later runs.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding the pickled analysis results
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._salt = _cache_salt()
+    
+    def key(self, relative_path: str, content: str) -> str:
+        """Compute the cache key for a file's current content."""
+        digest = hashlib.sha256(self._salt)
+        digest.update(relative_path.encode('utf-8', 'surrogateescape'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+    
+    def load_bytes(self, key: str) -> Optional[bytes]:
+        """Return the raw pickled entry for a key, or None if there is none."""
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Refresh the entry's mtime so prune() evicts least recently used first
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+    
+    def load(self, key: str) -> Optional['FileAnalysis']:
+        """Return the cached analysis for a key, or None on a miss."""
+        data = self.load_bytes(key)
+        if data is not None:
+            try:
+                analysis = pickle.loads(data)
+            except Exception:
+                # Truncated or incompatible entries are just misses
+                pass
+            else:
+                self.hits += 1
+                return analysis
+        
+        self.misses += 1
+        return None
+    
+    def store_bytes(self, key: str, data: bytes):
+        """Save a pickled analysis result; failures only cost a future cache miss."""
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+            tmp_path = None
+        except Exception as e:
+            print(f"⚠️  Could not cache analysis: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    def store(self, key: str, analysis: 'FileAnalysis'):
+        """Save an analysis result."""
+        self.store_bytes(key, pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def prune(self, max_bytes: int = CACHE_MAX_BYTES):
+        """Evict the least recently used entries until the cache fits in max_bytes."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [(stat.st_mtime, stat.st_size, entry.path)
+                           for entry in it if entry.name.endswith('.pkl')
+                           for stat in (entry.stat(),)]
+        except OSError:
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+class _PyCollector(ast.NodeVisitor):
+    """
+    Single-pass AST visitor collecting functions, classes, imports,
+    data models and cyclomatic complexity for one Python module.
+    
+    Defs directly in a class body are recorded only on their ClassInfo;
+    every other def, including ones under if/try/with in a class body
+    and functions nested inside methods, goes to functions.
+    Argument and module names repeat heavily across a codebase, so
+    they are interned to share one string object per distinct name.
+    """
+    
+    def __init__(self, analyzer: 'CodeAnalyzer'):
+        self.analyzer = analyzer
+        self.functions: List[FunctionInfo] = []
+        self.classes: List[ClassInfo] = []
+        self.imports: List[ImportInfo] = []
+        self.data_models: List[DataModelInfo] = []
+        self.complexity = 1  # Base complexity
+    
+    def _function_info(self, node) -> FunctionInfo:
+        """Build a FunctionInfo from a (async) function definition."""
+        return FunctionInfo(
+            name=node.name,
+            args=[sys.intern(arg.arg) for arg in node.args.args],
+            decorators=[self.analyzer._get_decorator_name(dec) for dec in node.decorator_list],
+            docstring=self._docstring(node),
+            line_number=node.lineno,
+            is_async=isinstance(node, ast.AsyncFunctionDef)
+        )
+    
+    @staticmethod
+    def _docstring(node) -> Optional[str]:
+        """Same result as ast.get_docstring, read straight off the first statement."""
+        body = node.body
+        if body and isinstance(body[0], ast.Expr):
+            value = body[0].value
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                text = value.value
+                # Only multi-line docstrings need cleandoc's margin handling
+                return inspect.cleandoc(text) if '\n' in text else text.expandtabs().lstrip()
+        return None
+    
+    def visit_FunctionDef(self, node):
+        self.functions.append(self._function_info(node))
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node):
+        analyzer = self.analyzer
+        methods = [self._function_info(item) for item in node.body
+                   if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        
+        self.classes.append(ClassInfo(
+            name=node.name,
+            bases=[analyzer._get_base_name(base) for base in node.bases],
+            methods=methods,
+            decorators=[analyzer._get_decorator_name(dec) for dec in node.decorator_list],
+            docstring=self._docstring(node),
+            line_number=node.lineno
+        ))
+        
+        # Check if it's a data model
+        if analyzer._is_data_model(node):
+            data_model = analyzer._extract_data_model(node)
+            if data_model:
+                self.data_models.append(data_model)
+        
+        # Methods are recorded on the ClassInfo above, so only their contents
+        # are visited. Defs under if/try/with in the class body still count.
+        for child in (*node.bases, *node.keywords, *node.body, *node.decorator_list):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.generic_visit(child)
+            else:
+                self.visit(child)
+    
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.imports.append(ImportInfo(
+                module=sys.intern(alias.name),
+                names=[sys.intern(alias.name)],
+                alias=alias.asname,
+                is_from_import=False
+            ))
+    
+    def visit_ImportFrom(self, node):
+        if node.module:
+            self.imports.append(ImportInfo(
+                module=sys.intern(node.module),
+                names=[alias.name for alias in node.names],
+                is_from_import=True
+            ))
+    
+    def _visit_branch(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+    
+    visit_If = visit_While = visit_For = visit_AsyncFor = _visit_branch
+    visit_ExceptHandler = visit_BoolOp = _visit_branch
+
+
+# JavaScript/TypeScript constructs, scanned in a single pass over each file.
+# At any position the earliest listed alternative wins, so e.g. an async
+# function is reported once rather than also as a plain function.
+_JS_CONSTRUCTS = [
+    ('async_function', r'async\s+function\s+(\w+)\s*\([^)]*\)'),
+    ('function', r'function\s+(\w+)\s*\([^)]*\)'),
+    ('arrow_function', r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>'),
+    ('require', r'const\s+(.+?)\s+=\s+require\([\'"](.+?)[\'"]\)'),
+    ('class', r'class\s+(\w+)(?:\s+extends\s+(\w+))?'),
+    ('import_from', r'import\s+(.+?)\s+from\s+[\'"](.+?)[\'"]'),
+    ('import', r'import\s+[\'"](.+?)[\'"]'),
+]
+_TS_CONSTRUCTS = [
+    ('interface', r'interface\s+(\w+)'),
+    ('type', r'type\s+(\w+)\s*='),
+]
+_JS_FUNCTION_KINDS = frozenset({'async_function', 'function', 'arrow_function'})
+
+# Property arrow functions often sit inside another construct's match, such as
+# a callback parameter in a function signature, so they get a pass of their own
+_JS_PROPERTY_FUNCTION_PATTERN = re.compile(r'(\w+)\s*:\s*\([^)]*\)\s*=>', re.MULTILINE)
+
+
+def _combine_patterns(constructs) -> re.Pattern:
+    """Compile (kind, pattern) pairs into one alternation with a named group per kind."""
+    return re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in constructs), re.MULTILINE)
+
+
+_JS_PATTERN = _combine_patterns(_JS_CONSTRUCTS)
+_TS_PATTERN = _combine_patterns(_JS_CONSTRUCTS + _TS_CONSTRUCTS)
+
+# Control-flow keywords counted for basic complexity, as whole words only
+_COMPLEXITY_PATTERN = re.compile(r'\b(?:if|else|elif|while|for|switch|case|try|catch)\b')
+
+
+def _set_to_list(obj):
+    """orjson fallback for the Set[str] fields of FeatureMap."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Projects with this many files or fewer aren't worth a process pool's startup cost
+PARALLEL_MIN_FILES = 8
+
+# Analyzer used by the current pool worker process, set by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(analyzer: 'CodeAnalyzer'):
+    """Process-pool initializer: keep a private copy of the analyzer."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_in_worker(file_path: str, language: str):
+    """Process-pool task: analyze one file to pickled bytes, reporting cache hits and misses."""
+    cache = _worker_analyzer.cache
+    hits, misses = (cache.hits, cache.misses) if cache else (0, 0)
+    data = _worker_analyzer._analyze_file_pickled(file_path, language)
+    if cache:
+        return data, cache.hits - hits, cache.misses - misses
+    return data, 0, 0
+
+
+def _pool_context():
+    """Prefer forkserver so pools are safe to start from threaded servers."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
 class CodeAnalyzer:
     """
     Main code analyzer class that processes code directories and extracts features.
@@ -115,15 +421,22 @@ class CodeAnalyzer:
         'env', 'build', 'dist', '.next', 'coverage', '.pytest_cache'
     }
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, cache_dir: Optional[Union[str, Path]] = None,
+                 jobs: Optional[int] = None):
         """
         Initialize the CodeAnalyzer.
         
         Args:
             project_path: Path to the project directory to analyze
+            cache_dir: Directory for the persistent analysis cache (default: None, no cache)
+            jobs: Number of worker processes (default: 1, analyzes serially in this process)
         """
         self.project_path = Path(project_path)
+        # Discovered file paths all start with this, so stripping it gives the relative path
+        self._path_prefix = os.path.join(str(self.project_path), '')
         self.feature_map = None
+        self.cache = SourceAstCache(cache_dir) if cache_dir else None
+        self.jobs = jobs or 1
         
     def analyze_project(self) -> FeatureMap:
         """
@@ -142,10 +455,14 @@ class CodeAnalyzer:
         global_classes = set()
         all_data_models = []
         
-        # Walk through all files in the project
-        for file_path in self._get_code_files():
+        # Analyze all files in the project, then aggregate in file order
+        code_files = self._get_code_files()
+        analyses = self._analyze_files(code_files)
+        if self.cache is not None:
+            self.cache.prune()
+        
+        for (file_path, _), analysis in zip(code_files, analyses):
             try:
-                analysis = self._analyze_file(file_path)
                 if analysis:
                     files_analysis.append(analysis)
                     
@@ -154,12 +471,9 @@ class CodeAnalyzer:
                     total_lines += analysis.lines_of_code
                     
                     # Collect global imports, functions, classes
-                    for imp in analysis.imports:
-                        global_imports.add(imp.module)
-                    for func in analysis.functions:
-                        global_functions.add(func.name)
-                    for cls in analysis.classes:
-                        global_classes.add(cls.name)
+                    global_imports.update(imp.module for imp in analysis.imports)
+                    global_functions.update(func.name for func in analysis.functions)
+                    global_classes.update(cls.name for cls in analysis.classes)
                     
                     # Collect data models
                     all_data_models.extend(analysis.data_models)
@@ -183,32 +497,99 @@ class CodeAnalyzer:
         
         return self.feature_map
     
-    def _get_code_files(self) -> List[Path]:
+    def _analyze_files(self, code_files: List[Tuple[str, str]]) -> List[Optional[FileAnalysis]]:
+        """
+        Analyze files, fanning out over a process pool for larger projects.
+        
+        Args:
+            code_files: (path, language) pairs of the files to analyze
+            
+        Returns:
+            Analysis results in the same order as code_files
+        """
+        if self.jobs <= 1 or len(code_files) <= PARALLEL_MIN_FILES:
+            return [self._analyze_file(file_path, language) for file_path, language in code_files]
+        
+        # Batch several files per task to keep inter-process traffic down
+        chunksize = max(1, len(code_files) // (self.jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs, mp_context=_pool_context(),
+                                     initializer=_init_worker, initargs=(self,)) as executor:
+                results = list(executor.map(_analyze_in_worker, *zip(*code_files), chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"⚠️  Parallel analysis unavailable ({e}), analyzing serially")
+            return [self._analyze_file(file_path, language) for file_path, language in code_files]
+        
+        analyses = []
+        for (file_path, language), (data, hits, misses) in zip(code_files, results):
+            if self.cache:
+                self.cache.hits += hits
+                self.cache.misses += misses
+            if data is None:
+                analyses.append(None)
+                continue
+            try:
+                analyses.append(pickle.loads(data))
+            except Exception:
+                # A corrupt cache entry passed through unchecked; redo this file here
+                if self.cache:
+                    self.cache.hits -= 1
+                analyses.append(self._analyze_file(file_path, language))
+        return analyses
+    
+    def _get_code_files(self) -> List[Tuple[str, str]]:
         """
         Get all code files in the project directory.
         
         Returns:
-            List of Path objects for code files
+            List of (path, language) pairs for code files
+        """
+        return list(self._iter_code_files())
+    
+    def _iter_code_files(self) -> Iterator[Tuple[str, str]]:
         """
-        code_files = []
+        Walk the project with os.scandir, yielding code files top-down.
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS]
-            
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                    code_files.append(file_path)
+        Yields:
+            (path, language) pairs, in the same order os.walk would visit the files
+        """
+        extensions = self.SUPPORTED_EXTENSIONS
+        stack = [str(self.project_path)]
         
-        return code_files
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip ignored directories
+                            if name not in self.IGNORE_DIRS:
+                                subdirs.append(entry.path)
+                        else:
+                            # The extension is lowered and looked up once, here. Names
+                            # without one (or dotfiles like '.py', which Path.suffix
+                            # also treats as extension-less) are rejected unsliced.
+                            dot = name.rfind('.')
+                            if dot <= 0:
+                                continue
+                            language = extensions.get(name[dot:].lower())
+                            if language and entry.is_file():
+                                yield entry.path, language
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+            
+            # Reversed so the first subdirectory is visited next
+            stack.extend(reversed(subdirs))
     
-    def _analyze_file(self, file_path: Path) -> Optional[FileAnalysis]:
+    def _analyze_file(self, file_path: str, language: Optional[str] = None) -> Optional[FileAnalysis]:
         """
         Analyze a single code file.
         
         Args:
             file_path: Path to the file to analyze
+            language: Language from discovery, looked up from the extension if omitted
             
         Returns:
             FileAnalysis object or None if analysis failed
@@ -217,37 +598,104 @@ class CodeAnalyzer:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
             
-            language = self.SUPPORTED_EXTENSIONS.get(file_path.suffix.lower(), 'unknown')
-            lines_of_code = len([line for line in content.split('\n') if line.strip()])
+            relative_path = file_path.removeprefix(self._path_prefix)
+            if self.cache is None:
+                return self._analyze_content(relative_path, content, language)
             
-            # Analyze based on language
-            if language == 'python':
-                return self._analyze_python_file(file_path, content, lines_of_code)
-            elif language in ['javascript', 'typescript']:
-                return self._analyze_js_ts_file(file_path, content, lines_of_code, language)
-            else:
-                # Basic analysis for other languages
-                return FileAnalysis(
-                    file_path=str(file_path.relative_to(self.project_path)),
-                    language=language,
-                    functions=[],
-                    classes=[],
-                    imports=[],
-                    data_models=[],
-                    lines_of_code=lines_of_code,
-                    complexity_score=self._calculate_basic_complexity(content)
-                )
+            cache_key = self.cache.key(relative_path, content)
+            analysis = self.cache.load(cache_key)
+            if analysis is None:
+                analysis = self._analyze_content(relative_path, content, language)
+                self.cache.store(cache_key, analysis)
+            return analysis
                 
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
             return None
     
-    def _analyze_python_file(self, file_path: Path, content: str, lines_of_code: int) -> FileAnalysis:
+    def _analyze_file_pickled(self, file_path: str, language: Optional[str] = None) -> Optional[bytes]:
+        """
+        Analyze a single code file for a pool worker, returning the pickled result.
+        
+        Cache hits are passed on exactly as stored, and fresh results are pickled
+        once for both the cache and the trip back to the parent process.
+        
+        Args:
+            file_path: Path to the file to analyze
+            language: Language from discovery, looked up from the extension if omitted
+            
+        Returns:
+            Pickled FileAnalysis or None if analysis failed
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            
+            relative_path = file_path.removeprefix(self._path_prefix)
+            if self.cache is None:
+                return pickle.dumps(self._analyze_content(relative_path, content, language), protocol=pickle.HIGHEST_PROTOCOL)
+            
+            cache_key = self.cache.key(relative_path, content)
+            data = self.cache.load_bytes(cache_key)
+            if data is not None:
+                self.cache.hits += 1
+                return data
+            
+            self.cache.misses += 1
+            data = pickle.dumps(self._analyze_content(relative_path, content, language), protocol=pickle.HIGHEST_PROTOCOL)
+            self.cache.store_bytes(cache_key, data)
+            return data
+                
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            return None
+    
+    def _analyze_content(self, file_path: str, content: str, language: Optional[str] = None) -> FileAnalysis:
+        """
+        Analyze the content of a single code file.
+        
+        Args:
+            file_path: Path of the file relative to the project
+            content: File content
+            language: Language of the file, looked up from the extension if omitted
+            
+        Returns:
+            FileAnalysis object
+        """
+        if language is None:
+            language = self.SUPPORTED_EXTENSIONS.get(file_path[file_path.rfind('.'):].lower(), 'unknown')
+        lines_of_code = self._count_code_lines(content)
+        
+        # Analyze based on language
+        if language == 'python':
+            return self._analyze_python_file(file_path, content, lines_of_code)
+        elif language in ['javascript', 'typescript']:
+            return self._analyze_js_ts_file(file_path, content, lines_of_code, language)
+        else:
+            # Basic analysis for other languages
+            return FileAnalysis(
+                file_path=file_path,
+                language=language,
+                functions=[],
+                classes=[],
+                imports=[],
+                data_models=[],
+                lines_of_code=lines_of_code,
+                complexity_score=self._calculate_basic_complexity(content)
+            )
+    
+    @staticmethod
+    def _count_code_lines(content: str) -> int:
+        """Count non-blank lines, letting C-level list methods do the filtering."""
+        lines = content.split('\n')
+        return len(lines) - lines.count('') - sum(map(str.isspace, lines))
+    
+    def _analyze_python_file(self, file_path: str, content: str, lines_of_code: int) -> FileAnalysis:
         """
         Analyze a Python file using AST.
         
         Args:
-            file_path: Path to the Python file
+            file_path: Path of the Python file relative to the project
             content: File content
             lines_of_code: Number of lines of code
             
@@ -255,11 +703,12 @@ class CodeAnalyzer:
             FileAnalysis object
         """
         try:
-            tree = ast.parse(content)
+            # No type-comment collection; the visitor never looks at them
+            tree = ast.parse(content, filename=file_path, type_comments=False)
         except SyntaxError as e:
             print(f"Syntax error in {file_path}: {e}")
             return FileAnalysis(
-                file_path=str(file_path.relative_to(self.project_path)),
+                file_path=file_path,
                 language='python',
                 functions=[],
                 classes=[],
@@ -269,90 +718,26 @@ class CodeAnalyzer:
                 complexity_score=0
             )
         
-        functions = []
-        classes = []
-        imports = []
-        data_models = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                func_info = FunctionInfo(
-                    name=node.name,
-                    args=[arg.arg for arg in node.args.args],
-                    decorators=[self._get_decorator_name(dec) for dec in node.decorator_list],
-                    docstring=ast.get_docstring(node),
-                    line_number=node.lineno,
-                    is_async=isinstance(node, ast.AsyncFunctionDef)
-                )
-                functions.append(func_info)
-                
-            elif isinstance(node, ast.ClassDef):
-                class_methods = []
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_info = FunctionInfo(
-                            name=item.name,
-                            args=[arg.arg for arg in item.args.args],
-                            decorators=[self._get_decorator_name(dec) for dec in item.decorator_list],
-                            docstring=ast.get_docstring(item),
-                            line_number=item.lineno,
-                            is_async=isinstance(item, ast.AsyncFunctionDef)
-                        )
-                        class_methods.append(method_info)
-                
-                class_info = ClassInfo(
-                    name=node.name,
-                    bases=[self._get_base_name(base) for base in node.bases],
-                    methods=class_methods,
-                    decorators=[self._get_decorator_name(dec) for dec in node.decorator_list],
-                    docstring=ast.get_docstring(node),
-                    line_number=node.lineno
-                )
-                classes.append(class_info)
-                
-                # Check if it's a data model
-                if self._is_data_model(node):
-                    data_model = self._extract_data_model(node)
-                    if data_model:
-                        data_models.append(data_model)
-                        
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    import_info = ImportInfo(
-                        module=alias.name,
-                        names=[alias.name],
-                        alias=alias.asname,
-                        is_from_import=False
-                    )
-                    imports.append(import_info)
-                    
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    names = [alias.name for alias in node.names]
-                    import_info = ImportInfo(
-                        module=node.module,
-                        names=names,
-                        is_from_import=True
-                    )
-                    imports.append(import_info)
+        collector = _PyCollector(self)
+        collector.visit(tree)
         
         return FileAnalysis(
-            file_path=str(file_path.relative_to(self.project_path)),
+            file_path=file_path,
             language='python',
-            functions=functions,
-            classes=classes,
-            imports=imports,
-            data_models=data_models,
+            functions=collector.functions,
+            classes=collector.classes,
+            imports=collector.imports,
+            data_models=collector.data_models,
             lines_of_code=lines_of_code,
-            complexity_score=self._calculate_python_complexity(tree)
+            complexity_score=collector.complexity
         )
     
-    def _analyze_js_ts_file(self, file_path: Path, content: str, lines_of_code: int, language: str) -> FileAnalysis:
+    def _analyze_js_ts_file(self, file_path: str, content: str, lines_of_code: int, language: str) -> FileAnalysis:
         """
         Analyze JavaScript/TypeScript files using regex patterns.
         
         Args:
-            file_path: Path to the JS/TS file
+            file_path: Path of the JS/TS file relative to the project
             content: File content
             lines_of_code: Number of lines of code
             language: 'javascript' or 'typescript'
@@ -365,93 +750,84 @@ class CodeAnalyzer:
         imports = []
         data_models = []
         
-        # Extract functions
-        func_patterns = [
-            r'function\s+(\w+)\s*\([^)]*\)',
-            r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>',
-            r'(\w+)\s*:\s*\([^)]*\)\s*=>',
-            r'async\s+function\s+(\w+)\s*\([^)]*\)'
-        ]
+        pattern = _TS_PATTERN if language == 'typescript' else _JS_PATTERN
+        group_index = pattern.groupindex
+        # Matches arrive in source order, so line numbers are kept by counting
+        # only the newlines between consecutive matches: one C-level sweep overall
+        line_num = 1
+        counted_to = 0
         
-        for pattern in func_patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
-                func_name = match.group(1)
-                line_num = content[:match.start()].count('\n') + 1
-                
-                func_info = FunctionInfo(
-                    name=func_name,
+        for match in pattern.finditer(content):
+            kind = match.lastgroup
+            # Captures of the matched construct follow its named group
+            first = group_index[kind] + 1
+            start = match.start()
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
+            
+            if kind in _JS_FUNCTION_KINDS:
+                functions.append(FunctionInfo(
+                    name=match.group(first),
                     args=[],  # Would need more complex parsing for args
                     decorators=[],
                     docstring=None,
                     line_number=line_num,
-                    is_async='async' in match.group(0)
-                )
-                functions.append(func_info)
-        
-        # Extract classes
-        class_pattern = r'class\s+(\w+)(?:\s+extends\s+(\w+))?'
-        class_matches = re.finditer(class_pattern, content, re.MULTILINE)
-        for match in class_matches:
-            class_name = match.group(1)
-            base_class = match.group(2) if match.group(2) else None
-            line_num = content[:match.start()].count('\n') + 1
+                    is_async=kind == 'async_function'
+                ))
             
-            class_info = ClassInfo(
-                name=class_name,
-                bases=[base_class] if base_class else [],
-                methods=[],  # Would need more complex parsing
-                decorators=[],
-                docstring=None,
-                line_number=line_num
-            )
-            classes.append(class_info)
-        
-        # Extract imports
-        import_patterns = [
-            r'import\s+(.+?)\s+from\s+[\'"](.+?)[\'"]',
-            r'import\s+[\'"](.+?)[\'"]',
-            r'const\s+(.+?)\s+=\s+require\([\'"](.+?)[\'"]\)'
-        ]
-        
-        for pattern in import_patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
-                if len(match.groups()) == 2:
-                    names = [match.group(1).strip()]
-                    module = match.group(2)
-                else:
-                    names = []
-                    module = match.group(1)
-                
-                import_info = ImportInfo(
-                    module=module,
-                    names=names,
+            elif kind == 'class':
+                base_class = match.group(first + 1)
+                classes.append(ClassInfo(
+                    name=match.group(first),
+                    bases=[base_class] if base_class else [],
+                    methods=[],  # Would need more complex parsing
+                    decorators=[],
+                    docstring=None,
+                    line_number=line_num
+                ))
+            
+            elif kind == 'import':
+                imports.append(ImportInfo(
+                    module=sys.intern(match.group(first)),
+                    names=[],
                     is_from_import=True
-                )
-                imports.append(import_info)
-        
-        # Extract TypeScript interfaces and types
-        if language == 'typescript':
-            interface_pattern = r'interface\s+(\w+)'
-            type_pattern = r'type\s+(\w+)\s*='
+                ))
             
-            for pattern, model_type in [(interface_pattern, 'interface'), (type_pattern, 'type')]:
-                matches = re.finditer(pattern, content, re.MULTILINE)
-                for match in matches:
-                    name = match.group(1)
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    data_model = DataModelInfo(
-                        name=name,
-                        type=model_type,
-                        fields=[],  # Would need more complex parsing
-                        line_number=line_num
-                    )
-                    data_models.append(data_model)
+            elif kind in ('import_from', 'require'):
+                imports.append(ImportInfo(
+                    module=sys.intern(match.group(first + 1)),
+                    names=[sys.intern(match.group(first).strip())],
+                    is_from_import=True
+                ))
+            
+            else:
+                # TypeScript interfaces and types
+                data_models.append(DataModelInfo(
+                    name=match.group(first),
+                    type=kind,
+                    fields=[],  # Would need more complex parsing
+                    line_number=line_num
+                ))
+        
+        # Second pass for property functions, merged back into source order
+        line_num = 1
+        counted_to = 0
+        for match in _JS_PROPERTY_FUNCTION_PATTERN.finditer(content):
+            start = match.start()
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
+            functions.append(FunctionInfo(
+                name=match.group(1),
+                args=[],  # Would need more complex parsing for args
+                decorators=[],
+                docstring=None,
+                line_number=line_num,
+                is_async=False
+            ))
+        functions.sort(key=attrgetter('line_number'))
         
         return FileAnalysis(
-            file_path=str(file_path.relative_to(self.project_path)),
+            file_path=file_path,
             language=language,
             functions=functions,
             classes=classes,
@@ -462,25 +838,17 @@ class CodeAnalyzer:
         )
     
     def _get_decorator_name(self, decorator) -> str:
-        """Extract decorator name from AST node."""
-        if isinstance(decorator, ast.Name):
-            return decorator.id
-        elif isinstance(decorator, ast.Attribute):
-            return f"{decorator.value.id}.{decorator.attr}"
-        elif isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                return decorator.func.id
-            elif isinstance(decorator.func, ast.Attribute):
-                return f"{decorator.func.value.id}.{decorator.func.attr}"
-        return str(decorator)
+        """Extract decorator name from AST node, without any call arguments."""
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        return self._get_base_name(decorator)
     
     def _get_base_name(self, base) -> str:
         """Extract base class name from AST node."""
         if isinstance(base, ast.Name):
             return base.id
-        elif isinstance(base, ast.Attribute):
-            return f"{base.value.id}.{base.attr}"
-        return str(base)
+        # Handles any expression shape: a.b.c, Generic[T], factory().attr, ...
+        return sys.intern(ast.unparse(base))
     
     def _is_data_model(self, node: ast.ClassDef) -> bool:
         """Check if a class is a data model."""
@@ -525,29 +893,9 @@ class CodeAnalyzer:
             line_number=node.lineno
         )
     
-    def _calculate_python_complexity(self, tree: ast.AST) -> int:
-        """Calculate cyclomatic complexity for Python code."""
-        complexity = 1  # Base complexity
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, (ast.And, ast.Or)):
-                complexity += 1
-        
-        return complexity
-    
     def _calculate_basic_complexity(self, content: str) -> int:
         """Calculate basic complexity based on control flow keywords."""
-        keywords = ['if', 'else', 'elif', 'while', 'for', 'switch', 'case', 'try', 'catch']
-        complexity = 1
-        
-        for keyword in keywords:
-            complexity += content.count(keyword)
-        
-        return complexity
+        return 1 + len(_COMPLEXITY_PATTERN.findall(content))
     
     def print_summary(self):
         """Print a summary of the analysis results."""
@@ -577,6 +925,9 @@ class CodeAnalyzer:
         print(f"🏗️  Global Classes: {len(fm.global_classes)}")
         print(f"📋 Data Models: {len(fm.data_models)}")
         
+        if self.cache is not None:
+            print(f"💾 Analysis Cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        
         if fm.data_models:
             print(f"\n📋 Data Models Found:")
             for model in fm.data_models[:5]:  # Show first 5
@@ -589,16 +940,20 @@ class CodeAnalyzer:
         
         print("\n" + "="*60)
     
-    def save_feature_map(self, output_path: str = "feature_map.json"):
+    def get_feature_map_dict(self) -> Optional[Dict[str, Any]]:
         """
-        Save the feature map to a JSON file.
+        Get the feature map as a JSON-serializable dictionary.
         
-        Args:
-            output_path: Path to save the JSON file
+        Returns:
+            Feature map dictionary, or None if no analysis has been run
         """
         if not self.feature_map:
-            print("❌ No analysis results available. Run analyze_project() first.")
-            return
+            return None
+        
+        if orjson is not None:
+            # Encoding the slotted dataclasses in C and decoding the result is
+            # several times faster than asdict()'s recursive copy
+            return orjson.loads(orjson.dumps(self.feature_map, default=_set_to_list))
         
         # Convert to dictionary for JSON serialization
         feature_map_dict = asdict(self.feature_map)
@@ -608,9 +963,28 @@ class CodeAnalyzer:
         feature_map_dict['global_functions'] = list(self.feature_map.global_functions)
         feature_map_dict['global_classes'] = list(self.feature_map.global_classes)
         
+        return feature_map_dict
+    
+    def save_feature_map(self, output_path: str = "feature_map.json"):
+        """
+        Save the feature map to a JSON file.
+        
+        Args:
+            output_path: Path to save the JSON file
+        """
+        if not self.feature_map:
+            print("❌ No analysis results available. Run analyze_project() first.")
+            return
+        
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(feature_map_dict, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson encodes the dataclasses directly, skipping the asdict() deep copy
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(self.feature_map, default=_set_to_list,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.get_feature_map_dict(), f, indent=2, ensure_ascii=False)
             
             print(f"✅ Feature map saved to: {output_path}")
             
@@ -626,6 +1000,11 @@ def main():
                        help='Output JSON file path (default: feature_map.json)')
     parser.add_argument('--no-summary', action='store_true', 
                        help='Skip printing summary to console')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                       help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--cache-dir', nargs='?', const=DEFAULT_CACHE_DIR, default=None,
+                       help=f'Cache per-file results across runs, in the given directory '
+                            f'or {DEFAULT_CACHE_DIR} (default: no cache)')
     
     args = parser.parse_args()
     
@@ -634,7 +1013,7 @@ def main():
         return
     
     # Initialize and run analyzer
-    analyzer = CodeAnalyzer(args.project_path)
+    analyzer = CodeAnalyzer(args.project_path, cache_dir=args.cache_dir, jobs=args.jobs)
     
     print("🚀 Starting code analysis...")
     feature_map = analyzer.analyze_project()
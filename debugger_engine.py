@@ -13,22 +13,165 @@ Version: 1.0
 import json
 import os
 import re
+import sys
 import difflib
-from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from itertools import count
+from operator import attrgetter
+from types import MappingProxyType
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup for report loading and the fixes summary, json is used without it
+    orjson = None
+
 
 class BugSeverity(Enum):
-    """Bug severity levels"""
+    """Bug severity levels, most severe first"""
     CRITICAL = "critical"
     MAJOR = "major"
     MINOR = "minor"
     INFO = "info"
 
+    def __init__(self, value: str):
+        # Integer sort rank (CRITICAL = 0), so sorting compares plain ints
+        self.rank = len(type(self).__members__)
+
+
+# Sort key ranking bugs most severe first
+_SEVERITY_KEY = attrgetter('severity.rank')
+
+_SEVERITY_EMOJI: Dict[str, str] = {"critical": "🔴", "major": "🟠", "minor": "🟡", "info": "🔵"}
+_DIVIDER = "=" * 60
+
+# Bugs shown by print_summary and returned by top_bugs by default
+_TOP_BUGS = 10
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string read from a report so repeated file paths share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _keyword_dispatch(*keywords: str) -> re.Pattern:
+    """
+    Compile a case-insensitive matcher for the first keyword present in a text
+    
+    Alternatives are tried in the order given, like an if/elif chain of
+    substring checks, and the match's lastgroup names the keyword found.
+    """
+    branches = '|'.join(f'.*?(?P<{keyword}>{keyword})' for keyword in keywords)
+    return re.compile(f'(?:{branches})', re.IGNORECASE | re.DOTALL)
+
+
+# Fixed snippets returned by the fix generators
+_API_ERROR_FIX = """
+try {
+    // API call here
+} catch (error) {
+    console.error('API Error:', error);
+    // Handle error appropriately
+}
+"""
+
+_BUTTON_FIX = """
+// Ensure button has proper event handlers
+<button 
+    onClick={handleClick}
+    disabled={isLoading}
+    aria-label="Action button"
+>
+    {isLoading ? 'Loading...' : 'Click me'}
+</button>
+"""
+
+_LOADING_FIX = """
+// Add proper loading state management
+const [isLoading, setIsLoading] = useState(false);
+
+// Show loading indicator
+{isLoading && <LoadingSpinner />}
+"""
+
+_QUALITY_SEVERITY_RE = _keyword_dispatch('security', 'performance')
+_QUALITY_SEVERITIES = {'security': BugSeverity.CRITICAL, 'performance': BugSeverity.MAJOR}
+
+_QUALITY_FIX_RE = _keyword_dispatch('unused', 'security', 'performance')
+_QUALITY_FIXES = {
+    'unused': "// Remove unused code",
+    'security': "// Add input validation and sanitization",
+    'performance': "// Optimize for better performance",
+}
+
+_ERROR_FIX_RE = _keyword_dispatch('api', 'undefined')
+_ERROR_FIXES = {
+    'api': _API_ERROR_FIX,
+    'undefined': "// Add null/undefined checks before accessing properties",
+}
+
+_UI_FIX_RE = _keyword_dispatch('button', 'loading')
+_UI_FIXES = {'button': _BUTTON_FIX, 'loading': _LOADING_FIX}
+
+
+def _build_bug_patterns() -> Mapping[str, Mapping[str, Any]]:
+    """Build the bug detection patterns, compiled once, and their fixes"""
+    # The keyword-only patterns (missing_implementation, console_logs,
+    # hardcoded_values) are literal alternations that re scans in one pass
+    # each. Nothing scans sources with these yet, so a multi-pattern
+    # automaton would only be worth adding alongside such a scanner
+    patterns = {
+        "missing_implementation": {
+            "pattern": re.compile(r"(TODO|FIXME|NotImplemented|placeholder)", re.MULTILINE),
+            "severity": BugSeverity.MAJOR,
+            "category": "Implementation",
+            "fix_template": "// Implement actual functionality here"
+        },
+        "unused_imports": {
+            # Possessive quantifiers keep every pattern linear-time; the
+            # former ".*\s+from" form backtracked quadratically on long lines
+            "pattern": re.compile(r"import\s++[^\n]*?\sfrom\s++['\"][^'\"\n]*+['\"];?[ \t]*+$", re.MULTILINE),
+            "severity": BugSeverity.MINOR,
+            "category": "Code Quality",
+            "fix_template": "// Remove unused import"
+        },
+        "console_logs": {
+            "pattern": re.compile(r"console\.(log|debug|info|warn|error)", re.MULTILINE),
+            "severity": BugSeverity.MINOR,
+            "category": "Code Quality",
+            "fix_template": "// Remove debug console statement"
+        },
+        "hardcoded_values": {
+            "pattern": re.compile(r"(http://localhost|127\.0\.0\.1|hardcoded)", re.MULTILINE),
+            "severity": BugSeverity.MAJOR,
+            "category": "Configuration",
+            "fix_template": "// Use environment variable or config"
+        },
+        "missing_error_handling": {
+            "pattern": re.compile(r"(fetch|axios|api)\s*+\([^)]*+\)(?!\s*\.catch)", re.MULTILINE),
+            "severity": BugSeverity.MAJOR,
+            "category": "Error Handling",
+            "fix_template": ".catch(error => console.error('API Error:', error))"
+        },
+        "accessibility_issues": {
+            "pattern": re.compile(r"<(button|input|img)(?![^>]*alt=)(?![^>]*aria-)", re.MULTILINE),
+            "severity": BugSeverity.MAJOR,
+            "category": "Accessibility",
+            "fix_template": "// Add accessibility attributes"
+        }
+    }
+    return MappingProxyType({name: MappingProxyType(spec) for name, spec in patterns.items()})
+
 
-@dataclass
+# Shared by every DebuggerEngine; read-only so one engine can't alter another's
+_BUG_PATTERNS = _build_bug_patterns()
+
+
+@dataclass(slots=True)
 class Bug:
     """Represents a detected bug with fix information"""
     id: str
@@ -44,7 +187,7 @@ class Bug:
     confidence: float  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeFix:
     """Represents a code fix with diff information"""
     bug_id: str
@@ -56,6 +199,26 @@ class CodeFix:
     unified_diff: str
 
 
+def write_chunks(path: str, chunks: List[bytes]):
+    """
+    Write byte chunks to a file with one gathered write, bypassing the io layer
+    
+    Args:
+        path: File to create or truncate
+        chunks: Byte strings written back to back
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # os.writev isn't available on Windows
+        written = os.writev(fd, chunks) if hasattr(os, 'writev') else 0
+        if written < sum(map(len, chunks)):
+            remaining = memoryview(b''.join(chunks))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
 class DebuggerEngine:
     """
     Main debugging engine that analyzes comparison reports and generates fixes
@@ -74,54 +237,14 @@ class DebuggerEngine:
         self.comparison_report: Optional[Dict] = None
         self.logs_data: Optional[Dict] = None
         self.ui_flows: Optional[Dict] = None
+        self._severity_counts: Optional[Dict[str, int]] = None
         
         # Create fixes directory if it doesn't exist
         os.makedirs(self.fixes_dir, exist_ok=True)
         
         # Bug detection patterns
-        self.bug_patterns = self._initialize_bug_patterns()
+        self.bug_patterns = _BUG_PATTERNS
         
-    def _initialize_bug_patterns(self) -> Dict[str, Dict]:
-        """Initialize bug detection patterns and their fixes"""
-        return {
-            "missing_implementation": {
-                "pattern": r"(TODO|FIXME|NotImplemented|placeholder)",
-                "severity": BugSeverity.MAJOR,
-                "category": "Implementation",
-                "fix_template": "// Implement actual functionality here"
-            },
-            "unused_imports": {
-                "pattern": r"import\s+.*\s+from\s+['\"].*['\"];?\s*$",
-                "severity": BugSeverity.MINOR,
-                "category": "Code Quality",
-                "fix_template": "// Remove unused import"
-            },
-            "console_logs": {
-                "pattern": r"console\.(log|debug|info|warn|error)",
-                "severity": BugSeverity.MINOR,
-                "category": "Code Quality",
-                "fix_template": "// Remove debug console statement"
-            },
-            "hardcoded_values": {
-                "pattern": r"(http://localhost|127\.0\.0\.1|hardcoded)",
-                "severity": BugSeverity.MAJOR,
-                "category": "Configuration",
-                "fix_template": "// Use environment variable or config"
-            },
-            "missing_error_handling": {
-                "pattern": r"(fetch|axios|api)\s*\([^)]*\)\s*(?!\.catch)",
-                "severity": BugSeverity.MAJOR,
-                "category": "Error Handling",
-                "fix_template": ".catch(error => console.error('API Error:', error))"
-            },
-            "accessibility_issues": {
-                "pattern": r"<(button|input|img)(?![^>]*alt=)(?![^>]*aria-)",
-                "severity": BugSeverity.MAJOR,
-                "category": "Accessibility",
-                "fix_template": "// Add accessibility attributes"
-            }
-        }
-    
     def load_comparison_report(self, report_path: str) -> bool:
         """
         Load comparison report from spec_comparer
@@ -133,14 +256,34 @@ class DebuggerEngine:
             bool: True if loaded successfully
         """
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                self.comparison_report = json.load(f)
+            if orjson is not None:
+                with open(report_path, 'rb') as f:
+                    self.comparison_report = orjson.loads(f.read())
+            else:
+                with open(report_path, 'r', encoding='utf-8') as f:
+                    self.comparison_report = json.load(f)
             print(f"✅ Loaded comparison report from {report_path}")
             return True
         except Exception as e:
             print(f"❌ Error loading comparison report: {e}")
             return False
     
+    def load_comparison_dict(self, report: Dict) -> bool:
+        """
+        Load an in-memory comparison report from spec_comparer
+        
+        Args:
+            report: Comparison report data
+            
+        Returns:
+            bool: True if loaded successfully
+        """
+        if not isinstance(report, dict):
+            print(f"❌ Error loading comparison report: expected an object, got {type(report).__name__}")
+            return False
+        self.comparison_report = report
+        return True
+    
     def load_logs(self, logs_path: str) -> bool:
         """
         Load runtime logs (stubbed for now)
@@ -195,44 +338,48 @@ class DebuggerEngine:
         Analyze loaded data to identify bugs
         
         Returns:
-            List[Bug]: List of identified bugs
+            List[Bug]: List of identified bugs, sorted by severity
+        """
+        self.bugs = sorted(self._iter_bugs(), key=_SEVERITY_KEY)
+        self._severity_counts = None
+        return self.bugs
+    
+    def top_bugs(self, k: int = _TOP_BUGS) -> List[Bug]:
         """
-        self.bugs = []
+        Get the k most severe bugs
         
-        if self.comparison_report:
-            self._analyze_comparison_report()
+        Args:
+            k: Number of bugs to return
         
+        Returns:
+            List[Bug]: Up to k bugs, most severe first
+        """
+        # analyze_bugs() leaves self.bugs sorted by severity
+        return self.bugs[:k]
+    
+    def _iter_bugs(self) -> Iterator[Bug]:
+        """Yield bugs from every loaded source in one pass, numbered in order"""
+        # Sources are walked sequentially on purpose: the work is pure Python
+        # under the GIL, and bug ids depend on the order bugs are produced
+        ids = count()
+        if self.comparison_report:
+            yield from self._iter_comparison_bugs(ids)
         if self.logs_data:
-            self._analyze_logs()
-        
+            yield from self._iter_log_bugs(ids)
         if self.ui_flows:
-            self._analyze_ui_flows()
-        
-        # Sort bugs by severity
-        severity_order = {
-            BugSeverity.CRITICAL: 0,
-            BugSeverity.MAJOR: 1,
-            BugSeverity.MINOR: 2,
-            BugSeverity.INFO: 3
-        }
-        self.bugs.sort(key=lambda bug: severity_order[bug.severity])
-        
-        return self.bugs
+            yield from self._iter_ui_bugs(ids)
     
-    def _analyze_comparison_report(self):
-        """Analyze comparison report for bugs"""
-        if not self.comparison_report:
-            return
-        
+    def _iter_comparison_bugs(self, ids: Iterator[int]) -> Iterator[Bug]:
+        """Yield bugs found in the comparison report"""
         # Analyze missing features
         missing_features = self.comparison_report.get('missing_features', [])
-        for feature in missing_features:
-            bug = Bug(
-                id=f"missing_{len(self.bugs)}",
+        yield from (
+            Bug(
+                id=f"missing_{next(ids)}",
                 title=f"Missing Feature: {feature.get('name', 'Unknown')}",
                 description=feature.get('description', 'Feature not implemented'),
                 severity=BugSeverity.MAJOR,
-                file_path=feature.get('expected_file', 'unknown'),
+                file_path=_intern(feature.get('expected_file', 'unknown')),
                 line_number=None,
                 category="Missing Implementation",
                 original_code=None,
@@ -240,17 +387,18 @@ class DebuggerEngine:
                 explanation=f"This feature was specified but not found in the codebase",
                 confidence=0.8
             )
-            self.bugs.append(bug)
+            for feature in missing_features
+        )
         
         # Analyze implementation gaps
         gaps = self.comparison_report.get('implementation_gaps', [])
-        for gap in gaps:
-            bug = Bug(
-                id=f"gap_{len(self.bugs)}",
+        yield from (
+            Bug(
+                id=f"gap_{next(ids)}",
                 title=f"Implementation Gap: {gap.get('component', 'Unknown')}",
                 description=gap.get('issue', 'Implementation incomplete'),
                 severity=BugSeverity.MAJOR,
-                file_path=gap.get('file', 'unknown'),
+                file_path=_intern(gap.get('file', 'unknown')),
                 line_number=gap.get('line', None),
                 category="Implementation Gap",
                 original_code=gap.get('current_code', None),
@@ -258,23 +406,18 @@ class DebuggerEngine:
                 explanation=gap.get('explanation', 'Code does not match specification'),
                 confidence=0.7
             )
-            self.bugs.append(bug)
+            for gap in gaps
+        )
         
         # Analyze code quality issues
         quality_issues = self.comparison_report.get('code_quality_issues', [])
-        for issue in quality_issues:
-            severity = BugSeverity.MINOR
-            if 'security' in issue.get('type', '').lower():
-                severity = BugSeverity.CRITICAL
-            elif 'performance' in issue.get('type', '').lower():
-                severity = BugSeverity.MAJOR
-            
-            bug = Bug(
-                id=f"quality_{len(self.bugs)}",
+        yield from (
+            Bug(
+                id=f"quality_{next(ids)}",
                 title=f"Code Quality: {issue.get('type', 'Unknown')}",
                 description=issue.get('description', 'Code quality issue detected'),
-                severity=severity,
-                file_path=issue.get('file', 'unknown'),
+                severity=self._quality_severity(issue),
+                file_path=_intern(issue.get('file', 'unknown')),
                 line_number=issue.get('line', None),
                 category="Code Quality",
                 original_code=issue.get('code', None),
@@ -282,23 +425,24 @@ class DebuggerEngine:
                 explanation=issue.get('explanation', 'Code quality can be improved'),
                 confidence=0.6
             )
-            self.bugs.append(bug)
+            for issue in quality_issues
+        )
     
-    def _analyze_logs(self):
-        """Analyze runtime logs for bugs"""
-        if not self.logs_data:
-            return
-        
+    def _quality_severity(self, issue: Dict) -> BugSeverity:
+        """Severity of a code quality issue, based on its type"""
+        match = _QUALITY_SEVERITY_RE.match(issue.get('type', ''))
+        return _QUALITY_SEVERITIES[match.lastgroup] if match else BugSeverity.MINOR
+    
+    def _iter_log_bugs(self, ids: Iterator[int]) -> Iterator[Bug]:
+        """Yield bugs found in the runtime logs"""
         # Analyze errors from logs
         errors = self.logs_data.get('errors', [])
-        for error in errors:
-            severity = BugSeverity.CRITICAL if error['level'] == 'error' else BugSeverity.MAJOR
-            
-            bug = Bug(
-                id=f"log_error_{len(self.bugs)}",
+        yield from (
+            Bug(
+                id=f"log_error_{next(ids)}",
                 title=f"Runtime Error: {error['message'][:50]}...",
                 description=error['message'],
-                severity=severity,
+                severity=BugSeverity.CRITICAL if error['level'] == 'error' else BugSeverity.MAJOR,
                 file_path="runtime",
                 line_number=None,
                 category="Runtime Error",
@@ -307,14 +451,15 @@ class DebuggerEngine:
                 explanation=f"Error occurred at {error['timestamp']}",
                 confidence=0.9
             )
-            self.bugs.append(bug)
+            for error in errors
+        )
         
         # Analyze performance issues
         performance = self.logs_data.get('performance', {})
         slow_queries = performance.get('slow_queries', [])
-        for query in slow_queries:
-            bug = Bug(
-                id=f"perf_{len(self.bugs)}",
+        yield from (
+            Bug(
+                id=f"perf_{next(ids)}",
                 title=f"Performance Issue: Slow {query}",
                 description=f"Function {query} is performing slowly",
                 severity=BugSeverity.MAJOR,
@@ -326,28 +471,24 @@ class DebuggerEngine:
                 explanation="Function execution time exceeds acceptable limits",
                 confidence=0.7
             )
-            self.bugs.append(bug)
+            for query in slow_queries
+        )
     
-    def _analyze_ui_flows(self):
-        """Analyze UI flows for bugs"""
-        if not self.ui_flows:
-            return
-        
+    def _iter_ui_bugs(self, ids: Iterator[int]) -> Iterator[Bug]:
+        """Yield bugs found in the UI flows"""
         # Analyze UI issues from flows
         ui_issues = self.ui_flows.get('ui_issues', [])
-        for issue in ui_issues:
-            severity_map = {
-                'critical': BugSeverity.CRITICAL,
-                'major': BugSeverity.MAJOR,
-                'minor': BugSeverity.MINOR
-            }
-            severity = severity_map.get(issue.get('severity', 'minor'), BugSeverity.MINOR)
-            
-            bug = Bug(
-                id=f"ui_{len(self.bugs)}",
+        severity_map = {
+            'critical': BugSeverity.CRITICAL,
+            'major': BugSeverity.MAJOR,
+            'minor': BugSeverity.MINOR
+        }
+        yield from (
+            Bug(
+                id=f"ui_{next(ids)}",
                 title=f"UI Issue: {issue['issue']}",
                 description=f"UI problem detected at {issue['timestamp']}s",
-                severity=severity,
+                severity=severity_map.get(issue.get('severity', 'minor'), BugSeverity.MINOR),
                 file_path="ui_component",
                 line_number=None,
                 category="User Interface",
@@ -356,7 +497,8 @@ class DebuggerEngine:
                 explanation="Issue detected during user interaction flow",
                 confidence=0.8
             )
-            self.bugs.append(bug)
+            for issue in ui_issues
+        )
     
     def _generate_feature_fix(self, feature: Dict) -> str:
         """Generate fix for missing feature"""
@@ -375,59 +517,20 @@ function implement{feature_name.replace(' ', '')}() {{
     def _generate_quality_fix(self, issue: Dict) -> str:
         """Generate fix for code quality issue"""
         issue_type = issue.get('type', 'unknown')
-        
-        if 'unused' in issue_type.lower():
-            return "// Remove unused code"
-        elif 'security' in issue_type.lower():
-            return "// Add input validation and sanitization"
-        elif 'performance' in issue_type.lower():
-            return "// Optimize for better performance"
-        else:
-            return f"// Fix {issue_type} issue"
+        match = _QUALITY_FIX_RE.match(issue_type)
+        return _QUALITY_FIXES[match.lastgroup] if match else f"// Fix {issue_type} issue"
     
     def _generate_error_fix(self, error: Dict) -> str:
         """Generate fix for runtime error"""
         message = error['message']
-        
-        if 'api' in message.lower():
-            return """
-try {
-    // API call here
-} catch (error) {
-    console.error('API Error:', error);
-    // Handle error appropriately
-}
-"""
-        elif 'undefined' in message.lower():
-            return "// Add null/undefined checks before accessing properties"
-        else:
-            return f"// Handle error: {message}"
+        match = _ERROR_FIX_RE.match(message)
+        return _ERROR_FIXES[match.lastgroup] if match else f"// Handle error: {message}"
     
     def _generate_ui_fix(self, issue: Dict) -> str:
         """Generate fix for UI issue"""
         issue_text = issue['issue']
-        
-        if 'button' in issue_text.lower():
-            return """
-// Ensure button has proper event handlers
-<button 
-    onClick={handleClick}
-    disabled={isLoading}
-    aria-label="Action button"
->
-    {isLoading ? 'Loading...' : 'Click me'}
-</button>
-"""
-        elif 'loading' in issue_text.lower():
-            return """
-// Add proper loading state management
-const [isLoading, setIsLoading] = useState(false);
-
-// Show loading indicator
-{isLoading && <LoadingSpinner />}
-"""
-        else:
-            return f"// Fix UI issue: {issue_text}"
+        match = _UI_FIX_RE.match(issue_text)
+        return _UI_FIXES[match.lastgroup] if match else f"// Fix UI issue: {issue_text}"
     
     def generate_fixes(self) -> List[CodeFix]:
         """
@@ -451,10 +554,15 @@ const [isLoading, setIsLoading] = useState(false);
         if not bug.original_code or not bug.proposed_fix:
             return None
         
-        original_lines = bug.original_code.split('\n')
-        fixed_lines = bug.proposed_fix.split('\n')
+        # splitlines() doesn't leave a trailing '' for text ending in a newline,
+        # which split('\n') would turn into a spurious blank line in the diff
+        original_lines = bug.original_code.splitlines()
+        fixed_lines = bug.proposed_fix.splitlines()
         
-        # Generate unified diff
+        # Generate unified diff. The inputs are snippets from the comparison report,
+        # and the .patch files must stay in a format patch/git apply understand.
+        # It is built eagerly: save_fixes writes it and the API server returns
+        # it as a CodeFix field, so every caller ends up needing it
         diff = difflib.unified_diff(
             original_lines,
             fixed_lines,
@@ -489,13 +597,15 @@ const [isLoading, setIsLoading] = useState(false);
                 patch_filename = f"{fix.bug_id}_{timestamp}.patch"
                 patch_path = os.path.join(self.fixes_dir, patch_filename)
                 
-                with open(patch_path, 'w', encoding='utf-8') as f:
-                    f.write(f"# Bug Fix: {fix.bug_id}\n")
-                    f.write(f"# File: {fix.file_path}\n")
-                    f.write(f"# Lines: {fix.start_line}-{fix.end_line}\n\n")
-                    f.write(fix.unified_diff)
+                header = (
+                    f"# Bug Fix: {fix.bug_id}\n"
+                    f"# File: {fix.file_path}\n"
+                    f"# Lines: {fix.start_line}-{fix.end_line}\n\n"
+                )
+                write_chunks(patch_path, [header.encode('utf-8'), fix.unified_diff.encode('utf-8')])
             
-            # Save summary report
+            # Save summary report. Bugs and fixes stay one object each, the
+            # layout documented in README_DebuggerEngine.md
             summary_path = os.path.join(self.fixes_dir, f"fixes_summary_{timestamp}.json")
             summary = {
                 "timestamp": timestamp,
@@ -506,8 +616,11 @@ const [isLoading, setIsLoading] = useState(false);
                 "fixes": [self._fix_to_dict(fix) for fix in self.fixes]
             }
             
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, default=str)
+            if orjson is not None:
+                write_chunks(summary_path, [orjson.dumps(summary, default=str, option=orjson.OPT_INDENT_2)])
+            else:
+                with open(summary_path, 'w', encoding='utf-8') as f:
+                    json.dump(summary, f, indent=2, default=str)
             
             print(f"💾 Saved {len(self.fixes)} fixes to {self.fixes_dir}/")
             return True
@@ -517,11 +630,11 @@ const [isLoading, setIsLoading] = useState(false);
             return False
     
     def _get_bugs_by_severity(self) -> Dict[str, int]:
-        """Get bug count by severity"""
-        counts = {severity.value: 0 for severity in BugSeverity}
-        for bug in self.bugs:
-            counts[bug.severity.value] += 1
-        return counts
+        """Get bug count by severity, memoized until the next analyze_bugs"""
+        if self._severity_counts is None:
+            counts = Counter(bug.severity for bug in self.bugs)
+            self._severity_counts = {severity.value: counts[severity] for severity in BugSeverity}
+        return dict(self._severity_counts)
     
     def _bug_to_dict(self, bug: Bug) -> Dict:
         """Convert Bug to dictionary"""
@@ -549,9 +662,9 @@ const [isLoading, setIsLoading] = useState(false);
     
     def print_summary(self):
         """Print summary of analysis and fixes"""
-        print("\n" + "="*60)
+        print("\n" + _DIVIDER)
         print("🔍 DEBUGGER ENGINE ANALYSIS SUMMARY")
-        print("="*60)
+        print(_DIVIDER)
         
         if not self.bugs:
             print("✅ No bugs detected!")
@@ -560,13 +673,13 @@ const [isLoading, setIsLoading] = useState(false);
         # Bug summary by severity
         severity_counts = self._get_bugs_by_severity()
         print(f"\n📊 BUGS BY SEVERITY:")
-        for severity, count in severity_counts.items():
-            if count > 0:
-                emoji = {"critical": "🔴", "major": "🟠", "minor": "🟡", "info": "🔵"}
-                print(f"   {emoji.get(severity, '⚪')} {severity.upper()}: {count}")
+        for severity, bug_count in severity_counts.items():
+            if bug_count > 0:
+                print(f"   {_SEVERITY_EMOJI.get(severity, '⚪')} {severity.upper()}: {bug_count}")
         
         print(f"\n📋 DETAILED BUG REPORT:")
-        for i, bug in enumerate(self.bugs[:10], 1):  # Show top 10
+        top_bugs = self.top_bugs()
+        for i, bug in enumerate(top_bugs, 1):
             print(f"\n{i}. [{bug.severity.value.upper()}] {bug.title}")
             print(f"   📁 File: {bug.file_path}")
             if bug.line_number:
@@ -576,13 +689,13 @@ const [isLoading, setIsLoading] = useState(false);
             if bug.proposed_fix:
                 print(f"   ✅ Fix available")
         
-        if len(self.bugs) > 10:
-            print(f"\n... and {len(self.bugs) - 10} more bugs")
+        if len(self.bugs) > len(top_bugs):
+            print(f"\n... and {len(self.bugs) - len(top_bugs)} more bugs")
         
         print(f"\n🔧 FIXES GENERATED: {len(self.fixes)}")
         print(f"💾 Fixes saved to: {self.fixes_dir}/")
         
-        print("\n" + "="*60)
+        print("\n" + _DIVIDER)
 
 
 def main():
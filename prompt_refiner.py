@@ -7,19 +7,311 @@ by identifying ambiguities and adding missing details for comprehensive app deve
 
 import json
 import logging
+import marshal
 import re
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup for writing specs, json is used without it
+    orjson = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Role vocabulary matched as whole words in a single pass
+_ROLE_RE = re.compile(
+    r'\b(admin|administrator|manager|moderator'
+    r'|user|customer|client|member'
+    r'|seller|vendor|merchant|store owner'
+    r'|buyer|shopper|consumer'
+    r'|teacher|instructor|educator'
+    r'|student|learner'
+    r'|author|writer|creator|contributor)\b'
+)
+
+# Name and purpose patterns are tried in priority order, so they stay separate
+_NAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'app called "([^"]+)"',
+    r'application named "([^"]+)"',
+    r'platform called "([^"]+)"',
+    r'"([^"]+)" app'
+))
+
+_PURPOSE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'to (help|enable|allow|provide) ([^.]+)',
+    r'for ([^.]+)',
+    r'that (helps|enables|allows|provides) ([^.]+)'
+))
+
+# Vague wording in a prompt and the clarifying question each one raises
+_VAGUE_TERMS = {
+    'simple': 'What specific features define "simple"?',
+    'easy': 'What makes it "easy" for users?',
+    'modern': 'What specific modern design elements are needed?',
+    'secure': 'What specific security measures are required?',
+    'fast': 'What are the specific performance requirements?',
+    'scalable': 'What are the expected user/data volume requirements?',
+    'user-friendly': 'What specific usability features are needed?'
+}
+
+
+# Marshal image of each frozen table, keyed by id() and holding the table
+# itself so the id is never reused. Thawing a table is then one C-level load.
+_THAWED_IMAGES: Dict[int, Tuple[Any, bytes]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable copy of a nested table of dicts and lists"""
+    if isinstance(value, (dict, MappingProxyType)):
+        frozen = MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    elif isinstance(value, (list, tuple)):
+        frozen = tuple(_freeze(item) for item in value)
+    else:
+        return value
+    _THAWED_IMAGES[id(frozen)] = (frozen, marshal.dumps(_thaw(frozen)))
+    return frozen
+
+
+def _thaw(value: Any) -> Any:
+    """Return a fresh mutable copy of a nested table, as plain dicts and lists"""
+    image = _THAWED_IMAGES.get(id(value))
+    if image is not None:
+        return marshal.loads(image[1])
+    # Most leaves are strings, so skip the call for them
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: item if type(item) is str else _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [item if type(item) is str else _thaw(item) for item in value]
+    return value
+
+
+# Static lookup tables shared by every spec. Nested tables are frozen, built
+# specs reference them directly, and generate_enhanced_spec thaws each spec
+# into fresh dicts and lists once on the way out.
+_APP_NAMES = {
+    'e-commerce': 'ShopHub',
+    'social': 'ConnectApp',
+    'productivity': 'TaskMaster',
+    'content': 'ContentPro',
+    'analytics': 'DataInsights',
+    'booking': 'BookEasy',
+    'learning': 'LearnHub',
+    'finance': 'FinanceTracker'
+}
+
+_TARGET_AUDIENCES = {
+    'e-commerce': 'Online shoppers and retail businesses',
+    'social': 'Social media users and communities',
+    'productivity': 'Professionals and teams seeking efficiency',
+    'content': 'Content creators and publishers',
+    'analytics': 'Business analysts and data-driven organizations',
+    'booking': 'Service providers and customers needing appointments',
+    'learning': 'Students, educators, and lifelong learners',
+    'finance': 'Individuals and businesses managing finances'
+}
+
+_CORE_PURPOSES = {
+    'e-commerce': 'Enable online buying and selling of products',
+    'social': 'Connect people and facilitate social interactions',
+    'productivity': 'Improve efficiency and task management',
+    'content': 'Create, manage, and publish content',
+    'analytics': 'Provide data insights and reporting',
+    'booking': 'Facilitate appointment scheduling and booking',
+    'learning': 'Deliver educational content and learning experiences',
+    'finance': 'Manage financial transactions and budgeting'
+}
+
+_USER_ROLE = _freeze({
+    'name': 'user',
+    'description': 'Standard application user',
+    'permissions': ['read', 'create_own', 'update_own', 'delete_own']
+})
+
+_ADMIN_ROLE = _freeze({
+    'name': 'admin',
+    'description': 'System administrator with full access',
+    'permissions': ['read', 'create', 'update', 'delete', 'manage_users', 'system_config']
+})
+
+_ADMIN_APP_TYPES = ('e-commerce', 'content', 'analytics', 'booking', 'learning')
+
+_APP_TYPE_ROLES = _freeze({
+    'e-commerce': {
+        'name': 'seller',
+        'description': 'Product seller/vendor',
+        'permissions': ['read', 'create_products', 'update_products', 'manage_orders']
+    },
+    'learning': {
+        'name': 'instructor',
+        'description': 'Course instructor/teacher',
+        'permissions': ['read', 'create_courses', 'update_courses', 'grade_students']
+    }
+})
+
+_CORE_FEATURES = _freeze({
+    'e-commerce': (
+        {'name': 'product_catalog', 'priority': 'high', 'description': 'Browse and search products'},
+        {'name': 'shopping_cart', 'priority': 'high', 'description': 'Add/remove items from cart'},
+        {'name': 'checkout', 'priority': 'high', 'description': 'Complete purchase process'},
+        {'name': 'payment_processing', 'priority': 'high', 'description': 'Handle payments securely'},
+        {'name': 'order_management', 'priority': 'high', 'description': 'Track and manage orders'}
+    ),
+    'social': (
+        {'name': 'user_profiles', 'priority': 'high', 'description': 'User profile management'},
+        {'name': 'messaging', 'priority': 'high', 'description': 'Direct messaging between users'},
+        {'name': 'content_sharing', 'priority': 'high', 'description': 'Share posts and media'},
+        {'name': 'social_connections', 'priority': 'medium', 'description': 'Follow/friend system'}
+    ),
+    'productivity': (
+        {'name': 'task_management', 'priority': 'high', 'description': 'Create and manage tasks'},
+        {'name': 'project_organization', 'priority': 'high', 'description': 'Organize tasks into projects'},
+        {'name': 'collaboration', 'priority': 'medium', 'description': 'Team collaboration features'},
+        {'name': 'reporting', 'priority': 'medium', 'description': 'Progress and productivity reports'}
+    )
+})
+
+_FEATURE_DEFINITIONS = _freeze({
+    'authentication': {'name': 'user_authentication', 'priority': 'high', 'description': 'User login and registration'},
+    'search': {'name': 'search_functionality', 'priority': 'medium', 'description': 'Search and filter content'},
+    'notifications': {'name': 'notification_system', 'priority': 'medium', 'description': 'User notifications'},
+    'file_upload': {'name': 'file_management', 'priority': 'medium', 'description': 'Upload and manage files'},
+    'real_time': {'name': 'real_time_updates', 'priority': 'medium', 'description': 'Live updates and messaging'},
+    'mobile': {'name': 'mobile_optimization', 'priority': 'high', 'description': 'Mobile-responsive design'},
+    'admin': {'name': 'admin_panel', 'priority': 'medium', 'description': 'Administrative interface'}
+})
+
+_TECHNICAL_REQUIREMENTS = _freeze({
+    'frontend': {
+        'framework': 'React',
+        'styling': 'Tailwind CSS',
+        'state_management': 'React Context/Redux',
+        'routing': 'React Router'
+    },
+    'backend': {
+        'runtime': 'Node.js',
+        'framework': 'Express.js',
+        'api_style': 'REST',
+        'authentication': 'JWT'
+    },
+    'database': {
+        'type': 'PostgreSQL',
+        'orm': 'Prisma',
+        'caching': 'Redis'
+    },
+    'hosting': {
+        'frontend': 'Vercel/Netlify',
+        'backend': 'Railway/Heroku',
+        'database': 'Supabase/PlanetScale'
+    },
+    'development': {
+        'version_control': 'Git',
+        'package_manager': 'npm',
+        'bundler': 'Vite',
+        'testing': 'Jest + React Testing Library'
+    }
+})
+
+_BUSINESS_CONSTRAINTS = _freeze({
+    'budget': {
+        'development': 'To be determined',
+        'hosting': 'Cloud-based, scalable pricing',
+        'third_party_services': 'Pay-per-use model preferred'
+    },
+    'timeline': {
+        'mvp': '2-3 months',
+        'full_release': '4-6 months',
+        'iterations': 'Bi-weekly sprints'
+    },
+    'compliance': {
+        'data_protection': 'GDPR compliant',
+        'accessibility': 'WCAG 2.1 AA',
+        'security': 'OWASP guidelines'
+    },
+    'localization': {
+        'languages': ['English'],
+        'currencies': ['USD'],
+        'regions': ['North America']
+    }
+})
+
+_UI_REQUIREMENTS = _freeze({
+    'design_system': {
+        'style': 'Modern, clean, minimalist',
+        'color_scheme': 'Professional with brand colors',
+        'typography': 'Sans-serif, readable fonts',
+        'spacing': 'Consistent grid system'
+    },
+    'responsive_design': {
+        'mobile_first': True,
+        'breakpoints': ['mobile', 'tablet', 'desktop'],
+        'touch_friendly': True
+    },
+    'accessibility': {
+        'screen_reader': 'Full support',
+        'keyboard_navigation': 'Complete navigation',
+        'color_contrast': 'WCAG AA compliant',
+        'focus_indicators': 'Clear visual indicators'
+    },
+    'performance': {
+        'load_time': '< 3 seconds',
+        'interactive_time': '< 5 seconds',
+        'image_optimization': 'WebP format, lazy loading'
+    }
+})
+
+_PERFORMANCE_REQUIREMENTS = _freeze({
+    'response_time': {
+        'api_endpoints': '< 200ms average',
+        'page_load': '< 3 seconds',
+        'database_queries': '< 100ms'
+    },
+    'throughput': {
+        'concurrent_users': '1000+',
+        'requests_per_second': '100+',
+        'database_connections': '50+'
+    },
+    'scalability': {
+        'horizontal_scaling': 'Auto-scaling enabled',
+        'load_balancing': 'Multi-instance support',
+        'caching_strategy': 'Redis + CDN'
+    },
+    'monitoring': {
+        'uptime_target': '99.9%',
+        'error_rate': '< 0.1%',
+        'alerting': 'Real-time monitoring'
+    }
+})
+
+_DEPLOYMENT_REQUIREMENTS = _freeze({
+    'environments': {
+        'development': 'Local development setup',
+        'staging': 'Pre-production testing',
+        'production': 'Live application'
+    },
+    'ci_cd': {
+        'pipeline': 'GitHub Actions',
+        'testing': 'Automated test suite',
+        'deployment': 'Automated deployment on merge'
+    },
+    'infrastructure': {
+        'containerization': 'Docker containers',
+        'orchestration': 'Kubernetes (if needed)',
+        'monitoring': 'Application and infrastructure monitoring'
+    },
+    'domains': {
+        'staging': 'staging.app-domain.com',
+        'production': 'app-domain.com',
+        'ssl': 'Automated SSL certificates'
+    }
+})
+
+@dataclass(slots=True, frozen=True)
 class EnhancedSpec:
     """Data structure for enhanced app specification"""
     original_prompt: str
@@ -39,6 +331,12 @@ class EnhancedSpec:
     deployment_requirements: Dict[str, Any]
     ambiguities_resolved: List[Dict[str, str]]
     enhancement_timestamp: str
+    
+    def to_json(self) -> bytes:
+        """Encode the specification as indented UTF-8 JSON"""
+        if orjson is not None:
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        return json.dumps(asdict(self), indent=2, ensure_ascii=False).encode('utf-8')
 
 class PromptRefiner:
     """
@@ -67,6 +365,19 @@ class PromptRefiner:
             'mobile': ['mobile', 'responsive', 'app', 'ios', 'android'],
             'admin': ['admin', 'manage', 'control', 'moderate', 'dashboard']
         }
+        
+        # Each distinct keyword mapped to the app types and features it signals,
+        # so both are detected in one scan and shared keywords are checked once
+        self._keyword_tags: Dict[str, List[Tuple[str, str]]] = {}
+        for app_type, keywords in self.app_type_patterns.items():
+            for keyword in keywords:
+                self._keyword_tags.setdefault(keyword, []).append(('app_type', app_type))
+        for feature, keywords in self.common_features.items():
+            for keyword in keywords:
+                self._keyword_tags.setdefault(keyword, []).append(('feature', feature))
+        
+        # Specs depend only on the prompt, so repeated prompts reuse the build
+        self._cached_spec = lru_cache(maxsize=256)(self._build_enhanced_spec)
 
     def analyze_prompt(self, prompt: str) -> Dict[str, Any]:
         """
@@ -80,82 +391,62 @@ class PromptRefiner:
         """
         logger.info("Starting prompt analysis...")
         
+        # Every detector matches against the same lowercased copy
+        prompt_lower = prompt.lower()
+        app_type_scores, feature_hits = self._scan_keywords(prompt_lower)
+        
         analysis = {
-            'app_type': self._detect_app_type(prompt),
-            'detected_features': self._detect_features(prompt),
-            'user_roles': self._extract_user_roles(prompt),
-            'ambiguities': self._identify_ambiguities(prompt),
-            'technical_hints': self._extract_technical_hints(prompt),
-            'business_context': self._extract_business_context(prompt)
+            'app_type': self._detect_app_type(app_type_scores),
+            'detected_features': self._detect_features(feature_hits),
+            'user_roles': self._extract_user_roles(prompt_lower),
+            'ambiguities': self._identify_ambiguities(prompt_lower),
+            'technical_hints': self._extract_technical_hints(prompt_lower),
+            'business_context': self._extract_business_context(prompt_lower)
         }
         
-        logger.info(f"Detected app type: {analysis['app_type']}")
-        logger.info(f"Found {len(analysis['detected_features'])} features")
-        logger.info(f"Identified {len(analysis['ambiguities'])} ambiguities")
+        logger.info("Detected app type: %s", analysis['app_type'])
+        logger.info("Found %d features", len(analysis['detected_features']))
+        logger.info("Identified %d ambiguities", len(analysis['ambiguities']))
         
         return analysis
 
-    def _detect_app_type(self, prompt: str) -> str:
-        """Detect the primary app type based on keywords"""
-        prompt_lower = prompt.lower()
-        scores = {}
+    def _scan_keywords(self, prompt_lower: str) -> Tuple[Counter, Set[str]]:
+        """Score app types and collect features from one pass over the keyword tags"""
+        app_type_scores = Counter()
+        feature_hits = set()
         
-        for app_type, keywords in self.app_type_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in prompt_lower)
-            if score > 0:
-                scores[app_type] = score
+        for keyword, tags in self._keyword_tags.items():
+            if keyword in prompt_lower:
+                for kind, tag in tags:
+                    if kind == 'app_type':
+                        app_type_scores[tag] += 1
+                    else:
+                        feature_hits.add(tag)
         
-        return max(scores, key=scores.get) if scores else 'general'
+        return app_type_scores, feature_hits
 
-    def _detect_features(self, prompt: str) -> List[str]:
-        """Detect mentioned features in the prompt"""
-        prompt_lower = prompt.lower()
-        detected = []
+    def _detect_app_type(self, app_type_scores: Counter) -> str:
+        """Detect the primary app type from its keyword scores"""
+        if not app_type_scores:
+            return 'general'
         
-        for feature, keywords in self.common_features.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                detected.append(feature)
-        
-        return detected
+        # Ties go to the type listed first in app_type_patterns
+        return max(self.app_type_patterns, key=app_type_scores.__getitem__)
+
+    def _detect_features(self, feature_hits: Set[str]) -> List[str]:
+        """List the detected features in table order"""
+        return [feature for feature in self.common_features if feature in feature_hits]
 
-    def _extract_user_roles(self, prompt: str) -> List[str]:
+    def _extract_user_roles(self, prompt_lower: str) -> List[str]:
         """Extract mentioned user roles from the prompt"""
-        role_patterns = [
-            r'\b(admin|administrator|manager|moderator)\b',
-            r'\b(user|customer|client|member)\b',
-            r'\b(seller|vendor|merchant|store owner)\b',
-            r'\b(buyer|shopper|consumer)\b',
-            r'\b(teacher|instructor|educator)\b',
-            r'\b(student|learner)\b',
-            r'\b(author|writer|creator|contributor)\b'
-        ]
-        
-        roles = []
-        prompt_lower = prompt.lower()
-        
-        for pattern in role_patterns:
-            matches = re.findall(pattern, prompt_lower)
-            roles.extend(matches)
-        
-        return list(set(roles))
+        return list(set(_ROLE_RE.findall(prompt_lower)))
 
-    def _identify_ambiguities(self, prompt: str) -> List[Dict[str, str]]:
+    def _identify_ambiguities(self, prompt_lower: str) -> List[Dict[str, str]]:
         """Identify potential ambiguities in the prompt"""
         ambiguities = []
-        prompt_lower = prompt.lower()
         
         # Check for vague terms
-        vague_terms = {
-            'simple': 'What specific features define "simple"?',
-            'easy': 'What makes it "easy" for users?',
-            'modern': 'What specific modern design elements are needed?',
-            'secure': 'What specific security measures are required?',
-            'fast': 'What are the specific performance requirements?',
-            'scalable': 'What are the expected user/data volume requirements?',
-            'user-friendly': 'What specific usability features are needed?'
-        }
-        
-        for term, question in vague_terms.items():
+        for term, question in _VAGUE_TERMS.items():
             if term in prompt_lower:
                 ambiguities.append({
                     'type': 'vague_requirement',
@@ -188,10 +479,8 @@ class PromptRefiner:
         
         return ambiguities
 
-    def _extract_technical_hints(self, prompt: str) -> Dict[str, Any]:
+    def _extract_technical_hints(self, prompt_lower: str) -> Dict[str, Any]:
         """Extract technical requirements and hints from the prompt"""
-        prompt_lower = prompt.lower()
-        
         hints = {
             'platforms': [],
             'integrations': [],
@@ -222,7 +511,7 @@ class PromptRefiner:
         
         return hints
 
-    def _extract_business_context(self, prompt: str) -> Dict[str, Any]:
+    def _extract_business_context(self, prompt_lower: str) -> Dict[str, Any]:
         """Extract business context and constraints"""
         context = {
             'target_market': None,
@@ -231,8 +520,6 @@ class PromptRefiner:
             'compliance': []
         }
         
-        prompt_lower = prompt.lower()
-        
         # Business model detection
         if any(term in prompt_lower for term in ['subscription', 'monthly', 'plan']):
             context['business_model'] = 'subscription'
@@ -263,6 +550,17 @@ class PromptRefiner:
         """
         logger.info("Generating enhanced specification...")
         
+        # Hand out fresh containers so callers cannot alter the cached spec
+        cached_spec = self._cached_spec(prompt)
+        spec_fields = {field.name: _thaw(getattr(cached_spec, field.name)) for field in fields(cached_spec)}
+        spec_fields['enhancement_timestamp'] = datetime.now().isoformat()
+        enhanced_spec = EnhancedSpec(**spec_fields)
+        
+        logger.info("Enhanced specification generated successfully")
+        return enhanced_spec
+
+    def _build_enhanced_spec(self, prompt: str) -> EnhancedSpec:
+        """Build the specification for a prompt, leaving the timestamp to the caller"""
         analysis = self.analyze_prompt(prompt)
         
         # Generate app name if not explicitly mentioned
@@ -318,208 +616,64 @@ class PromptRefiner:
             performance_requirements=performance_requirements,
             deployment_requirements=deployment_requirements,
             ambiguities_resolved=resolved_ambiguities,
-            enhancement_timestamp=datetime.now().isoformat()
+            enhancement_timestamp=''
         )
         
-        logger.info("Enhanced specification generated successfully")
         return enhanced_spec
 
     def _generate_app_name(self, prompt: str, app_type: str) -> str:
         """Generate a suitable app name based on prompt and type"""
         # Try to extract name from prompt first
-        name_patterns = [
-            r'app called "([^"]+)"',
-            r'application named "([^"]+)"',
-            r'platform called "([^"]+)"',
-            r'"([^"]+)" app'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(1)
         
         # Generate based on app type
-        type_names = {
-            'e-commerce': 'ShopHub',
-            'social': 'ConnectApp',
-            'productivity': 'TaskMaster',
-            'content': 'ContentPro',
-            'analytics': 'DataInsights',
-            'booking': 'BookEasy',
-            'learning': 'LearnHub',
-            'finance': 'FinanceTracker'
-        }
-        
-        return type_names.get(app_type, 'MyApp')
+        return _APP_NAMES.get(app_type, 'MyApp')
 
-    def _define_user_roles(self, detected_roles: List[str], app_type: str) -> List[Dict[str, str]]:
-        """Define comprehensive user roles with permissions"""
-        roles = []
-        
+    def _define_user_roles(self, detected_roles: List[str], app_type: str) -> List[Mapping[str, Any]]:
+        """Define comprehensive user roles with permissions, as frozen table entries"""
         # Always include basic user role
-        roles.append({
-            'name': 'user',
-            'description': 'Standard application user',
-            'permissions': ['read', 'create_own', 'update_own', 'delete_own']
-        })
+        roles = [_USER_ROLE]
         
         # Add admin role for most app types
-        if app_type in ['e-commerce', 'content', 'analytics', 'booking', 'learning']:
-            roles.append({
-                'name': 'admin',
-                'description': 'System administrator with full access',
-                'permissions': ['read', 'create', 'update', 'delete', 'manage_users', 'system_config']
-            })
+        if app_type in _ADMIN_APP_TYPES:
+            roles.append(_ADMIN_ROLE)
         
         # Add specific roles based on app type
-        if app_type == 'e-commerce':
-            roles.append({
-                'name': 'seller',
-                'description': 'Product seller/vendor',
-                'permissions': ['read', 'create_products', 'update_products', 'manage_orders']
-            })
-        elif app_type == 'learning':
-            roles.append({
-                'name': 'instructor',
-                'description': 'Course instructor/teacher',
-                'permissions': ['read', 'create_courses', 'update_courses', 'grade_students']
-            })
+        if app_type in _APP_TYPE_ROLES:
+            roles.append(_APP_TYPE_ROLES[app_type])
         
         return roles
 
-    def _generate_features(self, detected_features: List[str], app_type: str) -> List[Dict[str, Any]]:
-        """Generate comprehensive features list"""
+    def _generate_features(self, detected_features: List[str], app_type: str) -> List[Mapping[str, Any]]:
+        """Generate comprehensive features list, as frozen table entries"""
         features = []
         
         # Core features based on app type
-        core_features = {
-            'e-commerce': [
-                {'name': 'product_catalog', 'priority': 'high', 'description': 'Browse and search products'},
-                {'name': 'shopping_cart', 'priority': 'high', 'description': 'Add/remove items from cart'},
-                {'name': 'checkout', 'priority': 'high', 'description': 'Complete purchase process'},
-                {'name': 'payment_processing', 'priority': 'high', 'description': 'Handle payments securely'},
-                {'name': 'order_management', 'priority': 'high', 'description': 'Track and manage orders'}
-            ],
-            'social': [
-                {'name': 'user_profiles', 'priority': 'high', 'description': 'User profile management'},
-                {'name': 'messaging', 'priority': 'high', 'description': 'Direct messaging between users'},
-                {'name': 'content_sharing', 'priority': 'high', 'description': 'Share posts and media'},
-                {'name': 'social_connections', 'priority': 'medium', 'description': 'Follow/friend system'}
-            ],
-            'productivity': [
-                {'name': 'task_management', 'priority': 'high', 'description': 'Create and manage tasks'},
-                {'name': 'project_organization', 'priority': 'high', 'description': 'Organize tasks into projects'},
-                {'name': 'collaboration', 'priority': 'medium', 'description': 'Team collaboration features'},
-                {'name': 'reporting', 'priority': 'medium', 'description': 'Progress and productivity reports'}
-            ]
-        }
-        
-        features.extend(core_features.get(app_type, []))
+        features.extend(_CORE_FEATURES.get(app_type, ()))
         
         # Add detected features
-        feature_definitions = {
-            'authentication': {'name': 'user_authentication', 'priority': 'high', 'description': 'User login and registration'},
-            'search': {'name': 'search_functionality', 'priority': 'medium', 'description': 'Search and filter content'},
-            'notifications': {'name': 'notification_system', 'priority': 'medium', 'description': 'User notifications'},
-            'file_upload': {'name': 'file_management', 'priority': 'medium', 'description': 'Upload and manage files'},
-            'real_time': {'name': 'real_time_updates', 'priority': 'medium', 'description': 'Live updates and messaging'},
-            'mobile': {'name': 'mobile_optimization', 'priority': 'high', 'description': 'Mobile-responsive design'},
-            'admin': {'name': 'admin_panel', 'priority': 'medium', 'description': 'Administrative interface'}
-        }
-        
         for feature in detected_features:
-            if feature in feature_definitions:
-                features.append(feature_definitions[feature])
+            if feature in _FEATURE_DEFINITIONS:
+                features.append(_FEATURE_DEFINITIONS[feature])
         
         return features
 
-    def _define_technical_requirements(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _define_technical_requirements(self, analysis: Dict[str, Any]) -> Mapping[str, Any]:
         """Define comprehensive technical requirements"""
-        return {
-            'frontend': {
-                'framework': 'React',
-                'styling': 'Tailwind CSS',
-                'state_management': 'React Context/Redux',
-                'routing': 'React Router'
-            },
-            'backend': {
-                'runtime': 'Node.js',
-                'framework': 'Express.js',
-                'api_style': 'REST',
-                'authentication': 'JWT'
-            },
-            'database': {
-                'type': 'PostgreSQL',
-                'orm': 'Prisma',
-                'caching': 'Redis'
-            },
-            'hosting': {
-                'frontend': 'Vercel/Netlify',
-                'backend': 'Railway/Heroku',
-                'database': 'Supabase/PlanetScale'
-            },
-            'development': {
-                'version_control': 'Git',
-                'package_manager': 'npm',
-                'bundler': 'Vite',
-                'testing': 'Jest + React Testing Library'
-            }
-        }
+        return _TECHNICAL_REQUIREMENTS
 
-    def _define_business_constraints(self, business_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _define_business_constraints(self, business_context: Dict[str, Any]) -> Mapping[str, Any]:
         """Define business constraints and requirements"""
-        return {
-            'budget': {
-                'development': 'To be determined',
-                'hosting': 'Cloud-based, scalable pricing',
-                'third_party_services': 'Pay-per-use model preferred'
-            },
-            'timeline': {
-                'mvp': '2-3 months',
-                'full_release': '4-6 months',
-                'iterations': 'Bi-weekly sprints'
-            },
-            'compliance': {
-                'data_protection': 'GDPR compliant',
-                'accessibility': 'WCAG 2.1 AA',
-                'security': 'OWASP guidelines'
-            },
-            'localization': {
-                'languages': ['English'],
-                'currencies': ['USD'],
-                'regions': ['North America']
-            }
-        }
+        return _BUSINESS_CONSTRAINTS
 
-    def _generate_ui_requirements(self, app_type: str) -> Dict[str, Any]:
+    def _generate_ui_requirements(self, app_type: str) -> Mapping[str, Any]:
         """Generate UI/UX requirements"""
-        return {
-            'design_system': {
-                'style': 'Modern, clean, minimalist',
-                'color_scheme': 'Professional with brand colors',
-                'typography': 'Sans-serif, readable fonts',
-                'spacing': 'Consistent grid system'
-            },
-            'responsive_design': {
-                'mobile_first': True,
-                'breakpoints': ['mobile', 'tablet', 'desktop'],
-                'touch_friendly': True
-            },
-            'accessibility': {
-                'screen_reader': 'Full support',
-                'keyboard_navigation': 'Complete navigation',
-                'color_contrast': 'WCAG AA compliant',
-                'focus_indicators': 'Clear visual indicators'
-            },
-            'performance': {
-                'load_time': '< 3 seconds',
-                'interactive_time': '< 5 seconds',
-                'image_optimization': 'WebP format, lazy loading'
-            }
-        }
+        return _UI_REQUIREMENTS
 
-    def _define_data_requirements(self, app_type: str, features: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _define_data_requirements(self, app_type: str, features: List[Mapping[str, Any]]) -> Dict[str, Any]:
         """Define data structure and requirements"""
         base_entities = {
             'users': {
@@ -615,97 +769,28 @@ class PromptRefiner:
         
         return base_security
 
-    def _define_performance_requirements(self) -> Dict[str, Any]:
+    def _define_performance_requirements(self) -> Mapping[str, Any]:
         """Define performance requirements"""
-        return {
-            'response_time': {
-                'api_endpoints': '< 200ms average',
-                'page_load': '< 3 seconds',
-                'database_queries': '< 100ms'
-            },
-            'throughput': {
-                'concurrent_users': '1000+',
-                'requests_per_second': '100+',
-                'database_connections': '50+'
-            },
-            'scalability': {
-                'horizontal_scaling': 'Auto-scaling enabled',
-                'load_balancing': 'Multi-instance support',
-                'caching_strategy': 'Redis + CDN'
-            },
-            'monitoring': {
-                'uptime_target': '99.9%',
-                'error_rate': '< 0.1%',
-                'alerting': 'Real-time monitoring'
-            }
-        }
+        return _PERFORMANCE_REQUIREMENTS
 
-    def _define_deployment_requirements(self, technical_hints: Dict[str, Any]) -> Dict[str, Any]:
+    def _define_deployment_requirements(self, technical_hints: Dict[str, Any]) -> Mapping[str, Any]:
         """Define deployment requirements"""
-        return {
-            'environments': {
-                'development': 'Local development setup',
-                'staging': 'Pre-production testing',
-                'production': 'Live application'
-            },
-            'ci_cd': {
-                'pipeline': 'GitHub Actions',
-                'testing': 'Automated test suite',
-                'deployment': 'Automated deployment on merge'
-            },
-            'infrastructure': {
-                'containerization': 'Docker containers',
-                'orchestration': 'Kubernetes (if needed)',
-                'monitoring': 'Application and infrastructure monitoring'
-            },
-            'domains': {
-                'staging': 'staging.app-domain.com',
-                'production': 'app-domain.com',
-                'ssl': 'Automated SSL certificates'
-            }
-        }
+        return _DEPLOYMENT_REQUIREMENTS
 
     def _define_target_audience(self, app_type: str) -> str:
         """Define target audience based on app type"""
-        audiences = {
-            'e-commerce': 'Online shoppers and retail businesses',
-            'social': 'Social media users and communities',
-            'productivity': 'Professionals and teams seeking efficiency',
-            'content': 'Content creators and publishers',
-            'analytics': 'Business analysts and data-driven organizations',
-            'booking': 'Service providers and customers needing appointments',
-            'learning': 'Students, educators, and lifelong learners',
-            'finance': 'Individuals and businesses managing finances'
-        }
-        return audiences.get(app_type, 'General users')
+        return _TARGET_AUDIENCES.get(app_type, 'General users')
 
     def _define_core_purpose(self, prompt: str, app_type: str) -> str:
         """Extract or define the core purpose of the application"""
         # Try to extract purpose from prompt
-        purpose_patterns = [
-            r'to (help|enable|allow|provide) ([^.]+)',
-            r'for ([^.]+)',
-            r'that (helps|enables|allows|provides) ([^.]+)'
-        ]
-        
-        for pattern in purpose_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in _PURPOSE_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 return match.group(0)
         
         # Fallback to app type purpose
-        purposes = {
-            'e-commerce': 'Enable online buying and selling of products',
-            'social': 'Connect people and facilitate social interactions',
-            'productivity': 'Improve efficiency and task management',
-            'content': 'Create, manage, and publish content',
-            'analytics': 'Provide data insights and reporting',
-            'booking': 'Facilitate appointment scheduling and booking',
-            'learning': 'Deliver educational content and learning experiences',
-            'finance': 'Manage financial transactions and budgeting'
-        }
-        
-        return purposes.get(app_type, 'Provide value to users through digital solutions')
+        return _CORE_PURPOSES.get(app_type, 'Provide value to users through digital solutions')
 
     def _resolve_ambiguities(self, ambiguities: List[Dict[str, str]], analysis: Dict[str, Any]) -> List[Dict[str, str]]:
         """Resolve identified ambiguities with specific recommendations"""
@@ -756,16 +841,13 @@ class PromptRefiner:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"enhanced_spec_{timestamp}.json"
         
-        logger.info(f"Saving enhanced specification to {filename}")
-        
-        # Convert dataclass to dictionary
-        spec_dict = asdict(enhanced_spec)
+        logger.info("Saving enhanced specification to %s", filename)
         
         # Save to JSON file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(spec_dict, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(enhanced_spec.to_json())
         
-        logger.info(f"Enhanced specification saved successfully to {filename}")
+        logger.info("Enhanced specification saved successfully to %s", filename)
         return filename
 
     def refine_prompt(self, prompt: str, output_file: Optional[str] = None) -> EnhancedSpec:
@@ -780,7 +862,7 @@ class PromptRefiner:
             EnhancedSpec: The enhanced specification
         """
         logger.info("=== Starting Prompt Refinement Process ===")
-        logger.info(f"Original prompt: {prompt[:100]}...")
+        logger.info("Original prompt: %s...", prompt[:100])
         
         try:
             # Generate enhanced specification
@@ -790,12 +872,12 @@ class PromptRefiner:
             saved_file = self.save_enhanced_spec(enhanced_spec, output_file)
             
             logger.info("=== Prompt Refinement Completed Successfully ===")
-            logger.info(f"Enhanced specification saved to: {saved_file}")
+            logger.info("Enhanced specification saved to: %s", saved_file)
             
             return enhanced_spec
             
         except Exception as e:
-            logger.error(f"Error during prompt refinement: {str(e)}")
+            logger.error("Error during prompt refinement: %s", e)
             raise
 
 
@@ -803,6 +885,12 @@ def main():
     """
     Example usage of the PromptRefiner module
     """
+    # Logging is configured by the entry point, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     # Example prompt
     sample_prompt = """
     Create a simple e-commerce app where users can buy and sell products. 
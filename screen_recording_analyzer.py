@@ -22,6 +22,21 @@ import re
 from pathlib import Path
 
 
+def to_grayscale(frame: np.ndarray) -> np.ndarray:
+    """
+    Get a frame as single-channel grayscale.
+    
+    Args:
+        frame: BGR frame, or a frame that is already grayscale
+        
+    Returns:
+        Grayscale frame (the input itself if it was already grayscale)
+    """
+    if frame.ndim == 2:
+        return frame
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
 @dataclass
 class FrameInfo:
     """Information about a video frame"""
@@ -93,33 +108,32 @@ class ScreenRecordingAnalyzer:
         Calculate a hash for frame comparison.
         
         Args:
-            frame: OpenCV frame (numpy array)
+            frame: OpenCV frame (numpy array), BGR or grayscale
             
         Returns:
             MD5 hash string of the frame
         """
         # Convert to grayscale and resize for consistent hashing
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = to_grayscale(frame)
         resized = cv2.resize(gray, (64, 64))
         
-        # Calculate hash
-        frame_bytes = resized.tobytes()
-        return hashlib.md5(frame_bytes).hexdigest()
+        # Calculate hash, straight from the contiguous array without a bytes copy
+        return hashlib.md5(resized).hexdigest()
     
     def calculate_frame_difference(self, frame1: np.ndarray, frame2: np.ndarray) -> float:
         """
         Calculate the difference between two frames.
         
         Args:
-            frame1: First frame
-            frame2: Second frame
+            frame1: First frame, BGR or grayscale
+            frame2: Second frame, BGR or grayscale
             
         Returns:
             Difference score (0.0 = identical, 1.0 = completely different)
         """
         # Convert to grayscale
-        gray1 = cv2.cvtColor(frame1, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(frame2, cv2.COLOR_BGR2GRAY)
+        gray1 = to_grayscale(frame1)
+        gray2 = to_grayscale(frame2)
         
         # Resize for consistent comparison
         gray1 = cv2.resize(gray1, (640, 480))
@@ -137,14 +151,14 @@ class ScreenRecordingAnalyzer:
         Extract text from a frame using OCR.
         
         Args:
-            frame: OpenCV frame
+            frame: OpenCV frame, BGR or grayscale
             
         Returns:
             Tuple of (full_text, ui_elements_list)
         """
         try:
             # Preprocess frame for better OCR
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            gray = to_grayscale(frame)
             
             # Apply threshold to get better text recognition
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -514,7 +528,7 @@ class ScreenRecordingAnalyzer:
         
         # Load enhanced specification
         try:
-            with open(enhanced_spec_path, 'r') as f:
+            with open(enhanced_spec_path, 'r', encoding='utf-8') as f:
                 enhanced_spec = json.load(f)
         except Exception as e:
             print(f"❌ Error loading spec: {e}")
@@ -538,54 +552,73 @@ class ScreenRecordingAnalyzer:
         # Process frames
         frame_count = 0
         processed_frames = 0
-        prev_frame = None
+        prev_gray = None
+        # OCR results by a digest of the full grayscale frame; screen recordings
+        # repeat identical frames, and Tesseract dominates the per-frame cost
+        ocr_cache: Dict[bytes, Tuple[str, List[str]]] = {}
         
         while True:
+            # Sample frames at specified rate. Skipped frames still have to be
+            # decoded, but grab() spares converting and copying them out
+            if frame_count % frame_interval != 0:
+                if not cap.grab():
+                    break
+                frame_count += 1
+                continue
+            
             ret, frame = cap.read()
             if not ret:
                 break
             
-            # Sample frames at specified rate
-            if frame_count % frame_interval == 0:
-                timestamp = frame_count / fps if fps > 0 else frame_count
-                
-                # Calculate frame hash and difference
-                frame_hash = self.calculate_frame_hash(frame)
-                change_score = 0.0
-                is_key_frame = processed_frames == 0  # First frame is always key
-                
-                if prev_frame is not None:
-                    change_score = self.calculate_frame_difference(prev_frame, frame)
-                    is_key_frame = change_score > self.change_threshold
-                
-                # Extract text and UI elements
-                extracted_text, ui_elements = self.extract_text_from_frame(frame)
-                
-                # Create frame info
-                frame_info = FrameInfo(
-                    frame_number=frame_count,
-                    timestamp=timestamp,
-                    frame_hash=frame_hash,
-                    extracted_text=extracted_text,
-                    is_key_frame=is_key_frame,
-                    change_score=change_score,
-                    ui_elements=ui_elements
-                )
-                
-                self.frames.append(frame_info)
-                
-                # Save key frames
-                if is_key_frame:
-                    saved_path = self.save_key_frame(frame, frame_info)
-                    print(f"🖼️  Key frame saved: {saved_path} (change: {change_score:.3f})")
-                
-                prev_frame = frame.copy()
-                processed_frames += 1
-                
-                # Progress indicator
-                if processed_frames % 10 == 0:
-                    progress = (frame_count / total_frames) * 100
-                    print(f"⏳ Progress: {progress:.1f}% ({processed_frames} frames processed)")
+            timestamp = frame_count / fps if fps > 0 else frame_count
+            
+            # Hashing, differencing and OCR all work on grayscale, so
+            # convert once; only key frames are saved in color
+            gray = to_grayscale(frame)
+            
+            # Calculate frame hash and difference
+            frame_hash = self.calculate_frame_hash(gray)
+            change_score = 0.0
+            is_key_frame = processed_frames == 0  # First frame is always key
+            
+            if prev_gray is not None:
+                change_score = self.calculate_frame_difference(prev_gray, gray)
+                is_key_frame = change_score > self.change_threshold
+            
+            # Extract text and UI elements
+            ocr_key = hashlib.blake2b(np.ascontiguousarray(gray), digest_size=16).digest()
+            if ocr_key not in ocr_cache:
+                ocr_cache[ocr_key] = self.extract_text_from_frame(gray)
+            extracted_text, ui_elements = ocr_cache[ocr_key]
+            ui_elements = list(ui_elements)
+            
+            # Create frame info
+            frame_info = FrameInfo(
+                frame_number=frame_count,
+                timestamp=timestamp,
+                frame_hash=frame_hash,
+                extracted_text=extracted_text,
+                is_key_frame=is_key_frame,
+                change_score=change_score,
+                ui_elements=ui_elements
+            )
+            
+            self.frames.append(frame_info)
+            
+            # Save key frames
+            if is_key_frame:
+                saved_path = self.save_key_frame(frame, frame_info)
+                print(f"🖼️  Key frame saved: {saved_path} (change: {change_score:.3f})")
+            
+            # Converted frames are already a fresh array; copy only when
+            # the decoder returned grayscale directly
+            prev_gray = gray.copy() if gray is frame else gray
+            processed_frames += 1
+            
+            # Progress indicator
+            if processed_frames % 10 == 0:
+                progress = (frame_count / total_frames) * 100
+                print(f"⏳ Progress: {progress:.1f}% ({processed_frames} frames processed)")
             
             frame_count += 1
         
@@ -84,6 +84,30 @@ class SpecComparer:
             print(f"❌ Error loading Feature Map: {e}")
             return False
     
+    # Top-level Enhanced Spec fields the comparison actually reads
+    SPEC_FIELDS = ('core_features', 'ui_components', 'api_endpoints',
+                   'data_flow', 'business_rules', 'security_requirements')
+    
+    @classmethod
+    def project_spec(cls, enhanced_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Return only the parts of an Enhanced Spec that affect a comparison"""
+        return {field: enhanced_spec[field] for field in cls.SPEC_FIELDS if field in enhanced_spec}
+    
+    def compare_spec_dict(self, enhanced_spec: Dict[str, Any], feature_map: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compare an in-memory Enhanced Spec with an in-memory Feature Map.
+        
+        Args:
+            enhanced_spec (Dict): Enhanced specification data
+            feature_map (Dict): Feature map data from CodeAnalyzer
+            
+        Returns:
+            Dict: Complete comparison results
+        """
+        self.enhanced_spec = enhanced_spec
+        self.feature_map = feature_map
+        return self.compare_specifications()
+    
     def identify_missing_features(self) -> List[Dict[str, Any]]:
         """
         Identify features specified in Enhanced Spec but missing in codebase.
@@ -290,6 +314,9 @@ class SpecComparer:
         impl_security = self.feature_map.get('security_features', [])
         
         for spec_sec in spec_security:
+            # PromptRefiner emits security requirements as plain strings
+            if isinstance(spec_sec, str):
+                spec_sec = {'name': spec_sec}
             sec_name = spec_sec.get('name', '').lower()
             
             matching_sec = None
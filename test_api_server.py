@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for the API server's background job endpoints
+
+Starts the server on a free local port and checks that /full-analysis
+answers 429 once MAX_PENDING_JOBS jobs are pending, and that /jobs/<id>
+reports unknown, processing and completed jobs.
+"""
+
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import api_server
+from api_server import APIHandler
+
+
+def request(base_url, path, data=None):
+    """Send a GET (or a JSON POST when data is given) and return (status, body)"""
+    body = None if data is None else json.dumps(data).encode('utf-8')
+    req = urllib.request.Request(base_url + path, data=body,
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+
+def test_job_endpoints(base_url):
+    """Test job slots and job status polling against a live server"""
+    print("🧪 Testing /full-analysis and /jobs/<id>")
+
+    # Hold the job open until the test has seen it processing
+    release_job = threading.Event()
+
+    def fake_full_analysis(prompt, codebase_path):
+        release_job.wait(timeout=10)
+        return {'success': True, 'prompt': prompt}
+
+    api_server.run_full_analysis = fake_full_analysis
+    api_server._job_slots = threading.BoundedSemaphore(1)
+
+    status, _ = request(base_url, '/jobs/unknown')
+    assert status == 404, f"expected 404 for an unknown job, got {status}"
+    print("✅ Unknown job returns 404")
+
+    status, started = request(base_url, '/full-analysis', {'prompt': 'Build a todo app'})
+    assert status == 200, f"expected 200 for the first job, got {status}"
+    job_id = started['job_id']
+
+    status, _ = request(base_url, '/full-analysis', {'prompt': 'Build another app'})
+    assert status == 429, f"expected 429 with every job slot taken, got {status}"
+    print("✅ Extra job beyond MAX_PENDING_JOBS returns 429")
+
+    status, job = request(base_url, f'/jobs/{job_id}')
+    assert status == 200 and job['status'] == 'processing', f"expected processing, got {status} {job}"
+    print("✅ Running job reports processing")
+
+    release_job.set()
+    # finish_job runs as a done callback, just after the result is set
+    deadline = time.monotonic() + 10
+    while job_id not in api_server._finished_jobs and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    status, job = request(base_url, f'/jobs/{job_id}')
+    assert status == 200 and job['status'] == 'completed', f"expected completed, got {status} {job}"
+    assert job['result']['prompt'] == 'Build a todo app'
+    print("✅ Finished job reports completed with its result")
+
+    # The finished job's slot is free again
+    status, _ = request(base_url, '/full-analysis', {'prompt': 'Build a notes app'})
+    assert status == 200, f"expected 200 once the slot is released, got {status}"
+    print("✅ Slot is released when a job finishes")
+
+    return True
+
+
+def main():
+    """Run the API server tests"""
+    print("🚀 API Server Test Suite")
+    print("=" * 50)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), APIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        success = test_job_endpoints(base_url)
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        success = False
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if success:
+        print("\n✅ All API server tests passed!")
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
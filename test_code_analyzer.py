@@ -236,6 +236,46 @@ def test_analyzer_on_sample():
         return False
 
 
+def test_conditional_class_defs():
+    """Test that defs under if/try/with in a class body are not dropped."""
+    print("\n🧪 Testing defs nested in class-level blocks...")
+    
+    source = """
+import sys
+
+class A:
+    def direct(self):
+        def helper():
+            pass
+    
+    if sys.platform == 'win32':
+        def conditional(self):
+            pass
+    
+    try:
+        def guarded(self):
+            pass
+    except ImportError:
+        pass
+    
+    with open(__file__):
+        def managed(self):
+            pass
+"""
+    
+    analyzer = CodeAnalyzer(os.getcwd())
+    analysis = analyzer._analyze_content("conditional_defs.py", source, "python")
+    
+    function_names = [func.name for func in analysis.functions]
+    method_names = [method.name for method in analysis.classes[0].methods]
+    
+    if function_names != ['helper', 'conditional', 'guarded', 'managed'] or method_names != ['direct']:
+        print(f"❌ Unexpected functions {function_names} / methods {method_names}")
+        return False
+    
+    print("✅ Conditional class-level defs collected")
+    return True
+
 def main():
     """Main test function."""
     print("🚀 Starting CodeAnalyzer Tests")
@@ -249,12 +289,18 @@ def main():
     # Test 2: Analyze sample project
     success2 = test_analyzer_on_sample()
     
+    print("\n" + "=" * 50)
+    
+    # Test 3: Defs nested in class-level blocks
+    success3 = test_conditional_class_defs()
+    
     print("\n" + "=" * 50)
     print("📊 Test Results:")
     print(f"   • Current project analysis: {'✅ PASSED' if success1 else '❌ FAILED'}")
     print(f"   • Sample project analysis: {'✅ PASSED' if success2 else '❌ FAILED'}")
+    print(f"   • Conditional class defs: {'✅ PASSED' if success3 else '❌ FAILED'}")
     
-    if success1 and success2:
+    if success1 and success2 and success3:
         print("\n🎉 All tests passed! CodeAnalyzer is working correctly.")
     else:
         print("\n⚠️  Some tests failed. Check the output above for details.")
@@ -238,6 +238,32 @@ def test_debugger_engine():
     return True
 
 
+def test_top_bugs():
+    """Test that top_bugs returns the most severe bugs in order"""
+    print("\n🧪 Testing top_bugs")
+    
+    with open("test_top_bugs_report.json", 'w', encoding='utf-8') as f:
+        json.dump(create_sample_comparison_report(), f, indent=2)
+    
+    try:
+        engine = DebuggerEngine(fixes_dir="test_fixes")
+        if not engine.load_comparison_report("test_top_bugs_report.json"):
+            print("❌ Failed to load comparison report")
+            return False
+        bugs = engine.analyze_bugs()
+    finally:
+        os.remove("test_top_bugs_report.json")
+    
+    ranks = [bug.severity.rank for bug in bugs]
+    assert ranks == sorted(ranks)
+    assert engine.top_bugs(3) == bugs[:3]
+    assert engine.top_bugs(len(bugs) + 5) == bugs
+    assert engine.top_bugs(0) == []
+    assert bugs[0].severity == BugSeverity.CRITICAL
+    
+    print(f"✅ top_bugs returned the {min(3, len(bugs))} most severe of {len(bugs)} bugs")
+    return True
+
 def demonstrate_fix_application():
     """Demonstrate how fixes would be applied"""
     print("\n" + "=" * 60)
@@ -300,6 +326,7 @@ if __name__ == "__main__":
     try:
         # Run the test
         success = test_debugger_engine()
+        success = success and test_top_bugs()
         
         if success:
             # Show fix application demo
@@ -5,6 +5,7 @@ Demonstrates usage with various example prompts
 """
 
 from prompt_refiner import PromptRefiner
+from dataclasses import asdict
 import json
 
 def test_ecommerce_prompt():
@@ -100,6 +101,42 @@ def test_vague_prompt():
     
     return enhanced_spec
 
+def test_cached_spec_isolation():
+    """Test that mutating a returned spec does not leak into the next one"""
+    print("\n=== Testing Cached Spec Isolation ===")
+
+    prompt = "Create an online store where admin users manage products and customers checkout with payment."
+
+    refiner = PromptRefiner()
+    first_spec = refiner.generate_enhanced_spec(prompt)
+    first_spec.features[0]['name'] = 'Tampered'
+    first_spec.user_roles.append({'name': 'Intruder'})
+    first_spec.technical_requirements['frontend']['framework'] = 'Tampered'
+    first_spec.performance_requirements.clear()
+    first_spec.data_requirements['entities'].clear()
+
+    second_spec = refiner.generate_enhanced_spec(prompt)
+    assert second_spec.features[0]['name'] != 'Tampered'
+    assert all(role['name'] != 'Intruder' for role in second_spec.user_roles)
+    assert second_spec.technical_requirements['frontend']['framework'] != 'Tampered'
+    assert second_spec.performance_requirements
+    assert second_spec.data_requirements['entities']
+
+    print("✅ Second spec unaffected by changes to the first")
+
+def test_to_json_matches_json_fallback():
+    """Test that EnhancedSpec.to_json writes what the json fallback would"""
+    print("\n=== Testing Spec JSON Output ===")
+
+    prompt = "Build a café booking app with appointments, payments and an admin dashboard."
+
+    refiner = PromptRefiner()
+    enhanced_spec = refiner.generate_enhanced_spec(prompt)
+    expected = json.dumps(asdict(enhanced_spec), indent=2, ensure_ascii=False).encode('utf-8')
+    assert enhanced_spec.to_json() == expected
+
+    print("✅ to_json output matches json.dumps")
+
 def compare_specs(specs):
     """Compare different generated specs"""
     print("\n=== Specification Comparison ===")
@@ -124,6 +161,8 @@ def main():
         specs.append(test_social_app_prompt())
         specs.append(test_productivity_app_prompt())
         specs.append(test_vague_prompt())
+        test_cached_spec_isolation()
+        test_to_json_matches_json_fallback()
         
         # Compare results
         compare_specs(specs)